@@ -26,20 +26,32 @@ Includes
     - `fill_lines`
     - `flip_lines_h`
     - `flip_lines_v`
+    - `flip_frames_h`
+    - `flip_frames_v`
     - `rotate`
+    - `rotate_line`
+    - `rotate_lines`
 - Framework
   - `Engine`
   - `Clock`
   - `Screen`
+  - `HeadlessScreen`
+  - `Recorder`
+  - `Profiler`
   - `Scene`
 - Datastructures
   - `PanelStyle`,
+  - `ScreenSnapshot`
+  - `SimulationStats`
+  - `TaskTimings`
+  - `Viewport`
   - `Animation`
   - `AnimationSet`
   - `Hitbox`
 - Functions
   - `load_texture`
   - `get_texture_size`
+  - `simulate`
 - Decorators
   - `group`
 - Enums
@@ -58,6 +70,7 @@ Includes
   - `Label`
   - `Panel`
   - `AnimatedSprite`
+  - `TileMap`
 - Feature dependent
   - `SimpleMovementComponent` (when using feature `keyboard`/`all`)
 """
@@ -82,16 +95,24 @@ __all__ = [
     "Engine",
     "Clock",
     "Screen",
+    "HeadlessScreen",
+    "Recorder",
+    "Profiler",
     "Scene",
     "AssetLoader",
     # Datastructures
     "PanelStyle",
+    "ScreenSnapshot",
+    "SimulationStats",
+    "TaskTimings",
+    "Viewport",
     "Animation",
     "AnimationSet",
     "Hitbox",
     # Functions
     "load_texture",
     "get_texture_size",
+    "simulate",
     # Decorators
     "group",
     # Enums
@@ -113,6 +134,7 @@ __all__ = [
     "Label",
     "Panel",
     "AnimatedSprite",
+    "TileMap",
 ]
 
 from typing import (
@@ -151,6 +173,11 @@ from charz_core import (
 from ._engine import Engine
 from ._clock import Clock
 from ._screen import Screen
+from ._headless_screen import HeadlessScreen, ScreenSnapshot
+from ._recorder import Recorder
+from ._profiler import Profiler, TaskTimings
+from ._simulation import simulate, SimulationStats
+from ._viewport import Viewport
 from ._time import Time
 from ._asset_loader import AssetLoader
 from ._grouping import Group
@@ -163,6 +190,7 @@ from ._prefabs.sprite import Sprite
 from ._prefabs.label import Label
 from ._prefabs.panel import Panel, PanelStyle
 from ._prefabs.animated_sprite import AnimatedSprite
+from ._prefabs.tile_map import TileMap
 from . import text
 
 # Import to add scene frame tasks
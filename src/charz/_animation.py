@@ -112,13 +112,14 @@ class Animation:
 
         if fill:  # NOTE: This fill logic has to be before flipping
             generator = map(partial(text.fill_lines, fill_char=fill_char), generator)
+        processed_frames = list(generator)
         if flip_h:
-            generator = map(text.flip_lines_h, generator)
+            processed_frames = text.flip_frames_h(processed_frames)
         if flip_v:
-            generator = map(text.flip_lines_v, generator)
+            processed_frames = text.flip_frames_v(processed_frames)
         if reverse:
-            generator = reversed(list(generator))
-        instance.frames = list(generator)
+            processed_frames.reverse()
+        instance.frames = processed_frames
         return instance
 
     def __init__(
@@ -150,13 +151,14 @@ class Animation:
         generator = map(load_texture, frame_directory)
         if fill:  # NOTE: This fill logic has to be before flipping
             generator = map(partial(text.fill_lines, fill_char=fill_char), generator)
+        frames = list(generator)
         if flip_h:
-            generator = map(text.flip_lines_h, generator)
+            frames = text.flip_frames_h(frames)
         if flip_v:
-            generator = map(text.flip_lines_v, generator)
+            frames = text.flip_frames_v(frames)
         if reverse:
-            generator = reversed(list(generator))
-        self.frames = list(generator)
+            frames.reverse()
+        self.frames = frames
 
     def __repr__(self) -> str:
         # Should never be empty, but if the programmer did it,
@@ -65,6 +65,7 @@ class TextureComponent(_Protocol):
     centered: bool
     z_index: int
     transparency: Char | None
+    static: bool
 
     def with_texture(self, texture_or_line: list[str] | str | Char, /) -> _Self: ...
     def with_unique_texture(self) -> _Self: ...
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import time
+import asyncio
 
 from ._non_negative import NonNegative
 
@@ -31,15 +32,40 @@ class Clock:
         clock = Clock(fps=0)  # Updates as fast as possible
     ```
 
+    For steady frame times, like when running physics, use precise mode:
+
+    ```python
+    from charz import Engine, Clock
+
+    class PhysicsGame(Engine):
+        clock = Clock(fps=60, precise=True, smoothing=0.5)
+    ```
+
     Attributes:
         `fps`: `NonNegative[float]` - Frames per second. If `0`, it will not sleep.
+        `precise`: `bool` - Whether to sleep most of the remaining time,
+            then spin for the last `spin_time` seconds, to start frames on time.
+            Frames are scheduled from when the previous frame should have started,
+            so oversleeping does not add up over time.
+        `smoothing`: `float` - Weight of the previous delta time in `delta`,
+            in range `[0, 1)`. If `0`, `delta` is the last measured frame time.
+        `spin_time`: `float` - Seconds to spin instead of sleeping, in precise mode.
         `delta`: `property[float]` - Read-only attribute for delta time,
             updated on each `tick` call.
+        `elapsed`: `property[float]` - Read-only attribute for time passed
+            since the last `tick` call finished.
     """
 
     fps = NonNegative[float](0)
-
-    def __init__(self, *, fps: float = 0) -> None:
+    spin_time: float = 0.002  # Covers the usual oversleep of `time.sleep`
+
+    def __init__(
+        self,
+        *,
+        fps: float = 0,
+        precise: bool = False,
+        smoothing: float = 0,
+    ) -> None:
         """Initialize with optional `fps`.
 
         `NOTE` When `fps` is set to `0`, it will **not** do any sleeping,
@@ -47,10 +73,22 @@ class Clock:
 
         Args:
             fps (float, optional): Frames per second. Defaults to `0`.
+            precise (bool, optional): Whether to use precise mode. Defaults to `False`.
+            smoothing (float, optional): Weight of the previous delta time,
+                in range `[0, 1)`. Defaults to `0`.
+
+        Raises:
+            ValueError: If `smoothing` is not in range `[0, 1)`.
         """
+        if not 0 <= smoothing < 1:
+            raise ValueError(
+                f"Parameter 'smoothing' must be in range [0, 1), got {smoothing}"
+            )
         self.fps = fps
-        self._delta = 1 / self.fps
-        self._last_tick = time.perf_counter()
+        self.precise = precise
+        self.smoothing = smoothing
+        self._delta = 1 / fps if fps else 0
+        self.reset()
 
     def __repr__(self) -> str:
         fps = self.fps  # Assign to temp var to use prettier formatting on next line
@@ -64,20 +102,74 @@ class Clock:
         """
         return self._delta
 
+    @property
+    def elapsed(self) -> float:
+        """Read-only attribute for time passed since the last `tick` call finished.
+
+        Useful for checking how much of the current frame has been used.
+        """
+        return time.perf_counter() - self._last_tick
+
+    def reset(self) -> None:
+        """Start measuring the current frame from now.
+
+        Called by `Engine` when it starts running, so the time before that,
+        like when the clock was created at import, is not part of the first `delta`.
+        """
+        self._last_tick = time.perf_counter()
+        self._target_tick = self._last_tick  # When the last frame should have started
+
     def tick(self) -> None:
-        """Sleeps for the remaining time to maintain desired `fps`."""
+        """Sleeps for the remaining time to maintain desired `fps`.
+
+        Afterwards, `delta` is updated with the measured time since the previous tick.
+        """
         current_time = time.perf_counter()
 
-        if self.fps == 0:  # Skip sleeping if `.fps` is zero
-            self._last_tick = current_time
-            return
+        if self.fps:  # Skip sleeping if `.fps` is zero
+            next_tick = self._get_next_tick(current_time)
+            if self.precise:
+                sleep_time = next_tick - current_time - self.spin_time
+                if sleep_time > 0:
+                    time.sleep(sleep_time)
+                # Spin for the last part, since `time.sleep` may oversleep
+                while (current_time := time.perf_counter()) < next_tick:
+                    pass
+            elif next_tick > current_time:
+                time.sleep(next_tick - current_time)
+                current_time = time.perf_counter()
+
+        self._update_delta(current_time)
+
+    async def tick_async(self) -> None:
+        """Awaits the remaining time to maintain desired `fps`, like `tick`.
+
+        Always yields to the event loop at least once, even if `fps` is `0`,
+        so other tasks can run between frames.
+
+        `NOTE` Does not spin in precise mode, since that would block the event loop,
+        but frames are still scheduled to not drift.
+        """
+        current_time = time.perf_counter()
+        sleep_time = 0.0
+        if self.fps:  # Skip sleeping if `.fps` is zero
+            sleep_time = max(0, self._get_next_tick(current_time) - current_time)
+        await asyncio.sleep(sleep_time)
+        self._update_delta(time.perf_counter())
 
+    def _get_next_tick(self, current_time: float) -> float:
         target_delta = 1 / self.fps  # Seconds
-        elapsed_time = current_time - self._last_tick
-        sleep_time = target_delta - elapsed_time
-        if sleep_time > 0:
-            time.sleep(sleep_time)
-            self._last_tick = time.perf_counter()
-        else:
-            self._last_tick = current_time
-        self._delta = max(0, sleep_time)
+        if not self.precise:
+            return self._last_tick + target_delta
+        target_tick = self._target_tick + target_delta
+        # Start over from now when more than a whole frame behind,
+        # instead of rushing several frames to catch up
+        if current_time - target_tick > target_delta:
+            target_tick = current_time
+        self._target_tick = target_tick
+        return target_tick
+
+    def _update_delta(self, current_time: float) -> None:
+        measured_delta = current_time - self._last_tick
+        self._last_tick = current_time
+        self._delta = self.smoothing * self._delta + (1 - self.smoothing) * measured_delta
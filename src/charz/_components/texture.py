@@ -2,13 +2,14 @@ from __future__ import annotations
 
 from copy import deepcopy
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
-from charz_core import Vec2i, Self, group
+from charz_core import Node, Scene, Vec2i, Self, group
 
 from .. import text
 from .._asset_loader import AssetLoader
 from .._grouping import Group
+from .._render_order import RenderOrder, get_render_order
 from .._annotations import Char
 
 
@@ -91,6 +92,11 @@ class TextureComponent:  # Component (mixin class)
         `centered`: `bool` - Whether the texture is centered.
         `z_index`: `int` - Z-order for rendering.
         `transparency`: `Char | None` - Character used to signal transparency.
+        `static`: `bool` - Whether the node is drawn to a cached layer,
+            which is only rendered again when a static node changes.
+            The layer is drawn in screen space, so it is also rendered again
+            when a camera moves, in which case static nodes are not faster.
+            Static nodes are drawn below all other nodes.
 
     Methods:
         `hide`
@@ -108,8 +114,29 @@ class TextureComponent:  # Component (mixin class)
                 instance.texture = class_texture
         else:
             instance.texture = []
+        # Register in render order of the scene it is created in,
+        # which is the same scene it is added to as a group member
+        instance._render_order = get_render_order(Scene.current)
+        instance._render_order.add(instance)
         return instance
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Class attributes like `z_index = 1` would hide the property,
+        # also when set by a mixin placed before this component,
+        # so use them as default of the attribute the property wraps
+        for name in cls._watched_attributes:
+            value = next(vars(base)[name] for base in cls.__mro__ if name in vars(base))
+            if isinstance(value, property):
+                continue
+            watched = next(
+                vars(base)[name]
+                for base in cls.__mro__
+                if isinstance(vars(base).get(name), property)
+            )
+            setattr(cls, f"_{name}", value)
+            setattr(cls, name, watched)
+
     @classmethod
     def from_file(cls, texture_path: Path | str, /) -> Self:
         """Load texture from file and create instance.
@@ -127,10 +154,72 @@ class TextureComponent:  # Component (mixin class)
 
     texture: list[str]
     unique_texture: bool = True
-    visible: bool = True
     centered: bool = False
-    z_index: int = 0
     transparency: Char | None = None
+    _visible: bool = True
+    _parent: Node | None = None
+    _z_index: int = 0
+    _static: bool = False
+    _render_order: RenderOrder | None = None
+    # Properties with side effects, which subclasses may override as class attributes
+    _watched_attributes: ClassVar[tuple[str, ...]] = (
+        "visible",
+        "parent",
+        "z_index",
+        "static",
+    )
+    # Bumped when `visible` or `parent` of any texture node changes
+    _visibility_version: ClassVar[int] = 0
+    # Cached result of `is_globally_visible`, valid for `_visibility_cache_version`
+    _visibility_cache_version: int = -1
+    _is_globally_visible: bool = True
+
+    @property
+    def visible(self) -> bool:
+        """Visibility state of the node."""
+        return self._visible
+
+    @visible.setter
+    def visible(self, value: bool) -> None:
+        self._visible = value
+        # Invalidate cached global visibility of all texture nodes,
+        # as descendants of this node are not known
+        TextureComponent._visibility_version += 1
+
+    @property
+    def parent(self) -> Node | None:
+        """Parent node, affecting global visibility."""
+        return self._parent
+
+    @parent.setter
+    def parent(self, value: Node | None) -> None:
+        self._parent = value
+        TextureComponent._visibility_version += 1  # Same as for `visible`
+
+    @property
+    def z_index(self) -> int:
+        """Z-order for rendering."""
+        return self._z_index
+
+    @z_index.setter
+    def z_index(self, value: int) -> None:
+        old_z_index = self._z_index
+        self._z_index = value
+        # Keep render order sorted when `z_index` changes
+        if value != old_z_index and self._render_order is not None:
+            self._render_order.move(self, old_z_index)
+
+    @property
+    def static(self) -> bool:
+        """Whether the node is drawn to a cached layer."""
+        return self._static
+
+    @static.setter
+    def static(self, value: bool) -> None:
+        self._static = value
+        # Move between static and dynamic render lists
+        if self._render_order is not None:
+            self._render_order.invalidate()
 
     def with_texture(self, texture_or_line: list[str] | str | Char, /) -> Self:
         """Chained method to set the texture of the node.
@@ -226,19 +315,29 @@ class TextureComponent:  # Component (mixin class)
     def is_globally_visible(self) -> bool:
         """Check whether the node and its ancestors are visible.
 
+        The result is cached, and only computed again after `visible` or `parent`
+        has been assigned on any texture node. When computed again,
+        the cached result of the parent is used, so each ancestor
+        is only checked once, even for many nodes sharing the same ancestors.
+
         Returns:
             bool: Global visibility.
         """
+        if self._visibility_cache_version == TextureComponent._visibility_version:
+            return self._is_globally_visible
         if not self.visible:
-            return False
-        parent = self.parent  # type: ignore
-        while parent is not None:
-            if not isinstance(parent, TextureComponent):
-                return True
-            if not parent.visible:
-                return False
-            parent = parent.parent  # type: ignore
-        return True
+            is_globally_visible = False
+        else:
+            parent = self.parent  # type: ignore
+            # Ancestors above the first node without `TextureComponent` are ignored
+            is_globally_visible = (
+                parent.is_globally_visible()
+                if isinstance(parent, TextureComponent)
+                else True
+            )
+        self._is_globally_visible = is_globally_visible
+        self._visibility_cache_version = TextureComponent._visibility_version
+        return is_globally_visible
 
     def get_texture_size(self) -> Vec2i:
         """Get the size of the texture.
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+from typing import Callable
+
 import charz_core
 
 from ._clock import Clock
+from ._profiler import Profiler
 from ._screen import Screen
 from ._time import Time
 
@@ -19,6 +23,23 @@ class Engine(charz_core.Engine):
     Attributes:
         clock (Clock): The clock instance for managing frame timing.
         screen (Screen): The screen instance for rendering output.
+        max_frame_skips (int): Maximum number of consecutive frames where
+            refreshing the screen is skipped, because it would not finish
+            before the next frame should start. `0` disables frame skipping.
+        fixed_fps (float): Fixed steps per second. If not `0`, frame tasks with
+            priority of at least `fixed_step_priority` run in fixed steps,
+            with `Time.delta` set to `1 / fixed_fps`, as many times as needed
+            to keep up with real time. The remaining frame tasks, like refreshing
+            the screen and ticking the clock, run once per frame afterwards,
+            with `Time.alpha` set to how far real time is into the next step.
+            `0` disables fixed steps.
+        max_fixed_steps (int): Maximum number of fixed steps per frame.
+            Time that could not be caught up with is dropped, so slow frames
+            slow down the simulation, instead of making the next frames slower.
+        fixed_step_priority (int): Lowest priority of frame tasks run in fixed steps.
+            Defaults to between `process_current_scene` and `refresh_screen`.
+        profiler (Profiler | None): Profiler timing each frame task,
+            enabled while running. `None` disables profiling.
 
     Example:
 
@@ -34,12 +55,31 @@ class Engine(charz_core.Engine):
         )
     ```
 
+    Running logic at a fixed rate, while rendering at a lower rate:
+
+    ```python
+    from charz import Engine, Clock
+
+    class PhysicsGame(Engine):
+        clock = Clock(fps=30)  # Rendered frames per second
+        fixed_fps = 120  # Logic steps per second
+    ```
+
     Could also use a custom `Screen` subclass (`charz_rust.RustScreen`),
     that was implemented in `Rust` for better performance
     """
 
     clock: Clock = Clock(fps=16)
     screen: Screen = Screen()
+    max_frame_skips: int = 0
+    _frame_skips: int = 0  # Consecutive frames skipped
+    fixed_fps: float = 0
+    max_fixed_steps: int = 5
+    fixed_step_priority: int = 85
+    _fixed_time: float = 0  # Real time not yet simulated by fixed steps
+    profiler: Profiler | None = None
+    _is_running_async: bool = False
+    _is_awaiting_clock: bool = False  # Whether `run_async` should await the clock
 
     def run(self) -> None:  # Extended main loop function
         """Run app/game, which will start the main loop.
@@ -48,25 +88,152 @@ class Engine(charz_core.Engine):
 
         This function is also responsible for setting up the `screen`,
         which given as an overridden class attribute of `Engine` subclass.
+        If `fixed_fps` is set, frame tasks are run in fixed steps (see `fixed_fps`).
         """
+        self.clock.reset()
         Time.delta = self.clock.delta
         # Handle special ANSI codes to setup
         self.screen.on_startup()
-        super().run()
+        if self.profiler is not None:
+            self.profiler.enable()
+        # NOTE: Frame tasks are wrapped globally while profiling,
+        #       so they are put back even if an error is raised, like on Ctrl+C
+        try:
+            if self.fixed_fps:
+                self._run_fixed_steps()
+            else:
+                super().run()
+        finally:
+            if self.profiler is not None:
+                self.profiler.disable()
         # Run cleanup function to clear output screen
         self.screen.on_cleanup()
 
+    async def run_async(self) -> None:
+        """Run app/game in the running event loop, like `run`.
+
+        Frame tasks are run in the same order as with `run`,
+        but instead of sleeping in `tick_clock`, `Clock.tick_async` is awaited,
+        so other tasks, like network I/O or other engines, can run between frames.
+        If the clock is not awaited in a frame, like when `tick_clock` is removed,
+        it still yields to the event loop once per frame.
+        Cancelling the task stops the loop, and still runs the cleanup.
+
+        `NOTE` `Time` and `Scene.current` are shared by every engine,
+        so engines sharing an event loop should each set `Scene.current`
+        in their own `update`.
+
+        Example:
+
+        ```python
+        import asyncio
+
+        async def main() -> None:
+            await asyncio.gather(MyGame().run_async(), serve_clients())
+
+        asyncio.run(main())
+        ```
+        """
+        self.clock.reset()
+        Time.delta = self.clock.delta
+        # Handle special ANSI codes to setup
+        self.screen.on_startup()
+        if self.profiler is not None:
+            self.profiler.enable()
+        if self.fixed_fps:
+            self._fixed_time = 1 / self.fixed_fps  # Start with a step in the first frame
+        self._is_running_async = True
+        self.is_running = True
+        # NOTE: Cleanup is also done when the task is cancelled,
+        #       which is the usual way to stop it in a shared event loop
+        try:
+            while self.is_running:
+                frame_tasks = (
+                    self._run_fixed_steps_of_frame()
+                    if self.fixed_fps
+                    # NOTE: Copied, since tasks may be added while awaiting
+                    else list(self.frame_tasks.values())
+                )
+                has_awaited = False
+                for frame_task in frame_tasks:
+                    frame_task(self)
+                    if self._is_awaiting_clock:  # Set by `tick_clock`
+                        self._is_awaiting_clock = False
+                        await self.clock.tick_async()
+                        Time.delta = self.clock.delta
+                        has_awaited = True
+                if not has_awaited:
+                    # Yield once per frame, even if `tick_clock` was removed
+                    await asyncio.sleep(0)
+                if self.fixed_fps:
+                    self._fixed_time += self.clock.delta
+        finally:
+            self._is_running_async = False
+            self._is_awaiting_clock = False
+            if self.profiler is not None:
+                self.profiler.disable()
+            # Run cleanup function to clear output screen
+            self.screen.on_cleanup()
+
+    def _run_fixed_steps(self) -> None:
+        self._fixed_time = 1 / self.fixed_fps  # Start with a step in the first frame
+        self.is_running = True
+        while self.is_running:
+            for frame_task in self._run_fixed_steps_of_frame():
+                frame_task(self)
+            self._fixed_time += self.clock.delta
+
+    def _run_fixed_steps_of_frame(self) -> list[Callable[[Engine], None]]:
+        # Run the fixed steps that are due,
+        # then return the remaining frame tasks, to be run once this frame
+        fixed_delta = 1 / self.fixed_fps
+        step_count, self._fixed_time = divmod(self._fixed_time, fixed_delta)
+        # NOTE: Tasks are split every frame, as tasks may be added at any time
+        step_tasks: list[Callable[[Engine], None]] = []
+        remaining_tasks: list[Callable[[Engine], None]] = []
+        for priority, frame_task in self.frame_tasks.items():
+            if priority >= self.fixed_step_priority:
+                step_tasks.append(frame_task)
+            else:
+                remaining_tasks.append(frame_task)
+        Time.delta = fixed_delta
+        for _ in range(min(int(step_count), self.max_fixed_steps)):
+            for frame_task in step_tasks:
+                frame_task(self)
+        Time.alpha = self._fixed_time / fixed_delta
+        return remaining_tasks
+
 
 # Define additional frame tasks
 
 
 def refresh_screen(engine: Engine) -> None:
-    """Call `refresh` on the screen to update the display."""
+    """Call `refresh` on the screen to update the display.
+
+    If frame skipping is enabled with `Engine.max_frame_skips`, the refresh is skipped
+    when the time already spent on this frame, plus the time the last refresh took,
+    exceeds the time available per frame. Logic still runs every frame,
+    so only rendering falls behind when the screen is slow.
+    """
+    if (
+        engine._frame_skips < engine.max_frame_skips
+        and engine.clock.fps
+        and engine.clock.elapsed + engine.screen.refresh_time > 1 / engine.clock.fps
+    ):
+        engine._frame_skips += 1
+        return
+    engine._frame_skips = 0
     engine.screen.refresh()
 
 
 def tick_clock(engine: Engine) -> None:
-    """Tick the clock to update the delta time."""
+    """Tick the clock to update the delta time.
+
+    When running with `Engine.run_async`, the clock is instead awaited right after.
+    """
+    if engine._is_running_async:
+        engine._is_awaiting_clock = True
+        return
     engine.clock.tick()
     Time.delta = engine.clock.delta
 
@@ -0,0 +1,333 @@
+from __future__ import annotations
+
+from array import array
+from typing import Iterable, Iterator, overload
+
+from colex import ColorValue, RESET
+
+from ._annotations import Char
+
+
+# Typecode for color ids, which are indices into `FrameBuffer.palette`
+COLOR_ID_TYPECODE = "I"
+# Color id reserved for `None`, meaning no color
+NO_COLOR_ID = 0
+
+
+class ColorPalette:
+    """`ColorPalette` class, interning colors as small integer ids.
+
+    Each distinct color is stored once, and gets the next free id.
+    The escape sequences used to switch to each color are compiled
+    when it is interned, so encoding a frame only does lookups by id.
+
+    Attributes:
+        `colors`: `list[ColorValue | None]` - Color for each color id.
+        `start_codes`: `list[str]` - Sequence switching to each color,
+            from the reset state.
+        `switch_codes`: `list[str]` - Sequence switching to each color,
+            from another color, which is reset first,
+            as the previous color may set other attributes.
+    """
+
+    __slots__ = ("colors", "start_codes", "switch_codes", "_color_ids")
+
+    def __init__(self) -> None:
+        self.colors: list[ColorValue | None] = [None]
+        self.start_codes: list[str] = [RESET]
+        self.switch_codes: list[str] = [RESET]
+        self._color_ids: dict[ColorValue | None, int] = {None: NO_COLOR_ID}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self)})"
+
+    def __len__(self) -> int:
+        return len(self.colors)
+
+    def __getitem__(self, color_id: int, /) -> ColorValue | None:
+        return self.colors[color_id]
+
+    def intern(self, color: ColorValue | None, /) -> int:
+        """Get color id for color, adding it if not already present.
+
+        Args:
+            color (ColorValue | None): Color to intern.
+
+        Returns:
+            int: Color id, which is the index of color in `colors`.
+        """
+        color_id = self._color_ids.get(color)
+        if color_id is None:
+            color_id = len(self.colors)
+            self.colors.append(color)
+            self.start_codes.append(color)  # type: ignore[arg-type]
+            self.switch_codes.append(RESET + color)  # type: ignore[operator]
+            self._color_ids[color] = color_id
+        return color_id
+
+
+class FrameBuffer:
+    """`FrameBuffer` class, storing a frame as flat parallel arrays.
+
+    Characters are stored in `chars`, and colors are stored in `colors`
+    as small integer ids from `palette`. Both are laid out row by row,
+    so the cell at `(x, y)` is found at index `y * width + x`.
+
+    Resetting is done with a slice copy from prebuilt blank arrays,
+    which avoids allocating new objects for each cell.
+
+    `NOTE` Copies made with `copy` share the same `palette`,
+    so color ids can be compared directly between them.
+
+    Attributes:
+        `width`: `int` - Width in characters.
+        `height`: `int` - Height in characters.
+        `fill`: `Char` - Character used for blank cells.
+        `chars`: `list[Char]` - Character of each cell.
+        `colors`: `array[int]` - Color id of each cell.
+        `palette`: `ColorPalette` - Color for each color id.
+    """
+
+    __slots__ = (
+        "width",
+        "height",
+        "fill",
+        "chars",
+        "colors",
+        "palette",
+        "_blank_chars",
+        "_blank_colors",
+    )
+
+    def __init__(self, width: int, height: int, fill: Char = " ") -> None:
+        """Initialize blank frame buffer with given width and height.
+
+        Args:
+            width (int): Width in characters.
+            height (int): Height in characters.
+            fill (Char, optional): Character used for blank cells. Defaults to `" "`.
+        """
+        self.palette = ColorPalette()
+        self.resize(width, height, fill)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.width}x{self.height})"
+
+    def resize(self, width: int, height: int, fill: Char) -> None:
+        """Resize and rebuild blank arrays, leaving every cell blank.
+
+        Args:
+            width (int): Width in characters.
+            height (int): Height in characters.
+            fill (Char): Character used for blank cells.
+        """
+        self.width = max(0, width)
+        self.height = max(0, height)
+        self.fill = fill
+        cell_count = self.width * self.height
+        self._blank_chars = [fill] * cell_count
+        self._blank_colors = array(COLOR_ID_TYPECODE, [NO_COLOR_ID]) * cell_count
+        self.chars = self._blank_chars.copy()
+        self.colors = self._blank_colors[:]
+
+    def reset(self) -> None:
+        """Set every cell to blank, keeping the current size."""
+        self.chars[:] = self._blank_chars
+        self.colors[:] = self._blank_colors
+
+    def reset_palette(self) -> None:
+        """Replace `palette` with a new one, and set every cell to blank.
+
+        Used to free colors that are no longer drawn, as `palette` only grows.
+        Copies made before keep the old `palette`.
+        """
+        self.palette = ColorPalette()
+        self.reset()
+
+    def intern_color(self, color: ColorValue | None, /) -> int:
+        """Get color id for color, adding it to `palette` if not already present.
+
+        Args:
+            color (ColorValue | None): Color to intern.
+
+        Returns:
+            int: Color id in `palette`.
+        """
+        return self.palette.intern(color)
+
+    def copy(self) -> FrameBuffer:
+        """Create copy of cells, sharing the same `palette`.
+
+        Returns:
+            FrameBuffer: Copy of frame buffer.
+        """
+        instance = self.__class__.__new__(self.__class__)
+        instance.width = self.width
+        instance.height = self.height
+        instance.fill = self.fill
+        instance.palette = self.palette
+        instance._blank_chars = self._blank_chars
+        instance._blank_colors = self._blank_colors
+        instance.chars = self.chars.copy()
+        instance.colors = self.colors[:]
+        return instance
+
+    def get_cell(self, index: int, /) -> tuple[Char, ColorValue | None]:
+        """Get cell at flat index, as pair of character and color."""
+        return (self.chars[index], self.palette[self.colors[index]])
+
+    def set_cell(self, index: int, cell: tuple[Char, ColorValue | None], /) -> None:
+        """Set cell at flat index, from pair of character and color."""
+        char, color = cell
+        self.chars[index] = char
+        self.colors[index] = self.intern_color(color)
+
+    def load_rows(self, rows: Iterable[Iterable[tuple[Char, ColorValue | None]]]) -> None:
+        """Load cells from rows of `(char, color)` pairs.
+
+        Cells outside the frame are ignored, and cells not given are left as is.
+
+        Args:
+            rows (Iterable[Iterable[tuple[Char, ColorValue | None]]]): Rows of pairs.
+        """
+        for row_index, row in zip(range(self.height), rows, strict=False):
+            row_start = row_index * self.width
+            for column, cell in zip(range(self.width), row, strict=False):
+                self.set_cell(row_start + column, cell)
+
+
+class BufferRowView:
+    """View of a single row in `FrameBuffer`, as `(char, color)` pairs.
+
+    Used by `Screen.buffer`, to stay compatible with code using nested lists.
+    """
+
+    __slots__ = ("_frame_buffer", "_row_start")
+    __hash__ = None  # type: ignore[assignment]  # Mutable, like `list`
+
+    def __init__(self, frame_buffer: FrameBuffer, row_index: int) -> None:
+        self._frame_buffer = frame_buffer
+        self._row_start = row_index * frame_buffer.width
+
+    def __len__(self) -> int:
+        return self._frame_buffer.width
+
+    def __iter__(self) -> Iterator[tuple[Char, ColorValue | None]]:
+        frame_buffer = self._frame_buffer
+        palette = frame_buffer.palette
+        row_end = self._row_start + frame_buffer.width
+        return zip(
+            frame_buffer.chars[self._row_start : row_end],
+            (
+                palette[color_id]
+                for color_id in frame_buffer.colors[self._row_start : row_end]
+            ),
+            strict=True,
+        )
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, BufferRowView | list | tuple):
+            return list(self) == list(other)
+        return NotImplemented
+
+    @overload
+    def __getitem__(self, key: int) -> tuple[Char, ColorValue | None]: ...
+    @overload
+    def __getitem__(self, key: slice) -> list[tuple[Char, ColorValue | None]]: ...
+    def __getitem__(
+        self,
+        key: int | slice,
+    ) -> tuple[Char, ColorValue | None] | list[tuple[Char, ColorValue | None]]:
+        if isinstance(key, slice):
+            return list(self)[key]
+        return self._frame_buffer.get_cell(self._row_start + self._to_column(key))
+
+    @overload
+    def __setitem__(self, key: int, value: tuple[Char, ColorValue | None]) -> None: ...
+    @overload
+    def __setitem__(
+        self,
+        key: slice,
+        value: Iterable[tuple[Char, ColorValue | None]],
+    ) -> None: ...
+    def __setitem__(
+        self,
+        key: int | slice,
+        value: tuple[Char, ColorValue | None] | Iterable[tuple[Char, ColorValue | None]],
+    ) -> None:
+        if isinstance(key, slice):
+            columns = range(self._frame_buffer.width)[key]
+            cells = list(value)  # type: ignore[arg-type]
+            if len(cells) != len(columns):
+                raise ValueError(
+                    f"Cannot change row length, expected {len(columns)} cells,"
+                    f" got {len(cells)}"
+                )
+            for column, cell in zip(columns, cells, strict=True):
+                self._frame_buffer.set_cell(self._row_start + column, cell)
+            return
+        self._frame_buffer.set_cell(
+            self._row_start + self._to_column(key),
+            value,  # type: ignore[arg-type]
+        )
+
+    def _to_column(self, index: int) -> int:
+        width = self._frame_buffer.width
+        if index < 0:
+            index += width
+        if not 0 <= index < width:
+            raise IndexError("Buffer row index out of range")
+        return index
+
+
+class BufferView:
+    """View of `FrameBuffer`, as rows of `(char, color)` pairs.
+
+    Used by `Screen.buffer`, to stay compatible with code using nested lists,
+    like `buffer[y][x] = (char, color)`.
+    """
+
+    __slots__ = ("_frame_buffer",)
+    __hash__ = None  # type: ignore[assignment]  # Mutable, like `list`
+
+    def __init__(self, frame_buffer: FrameBuffer) -> None:
+        self._frame_buffer = frame_buffer
+
+    def __len__(self) -> int:
+        return self._frame_buffer.height
+
+    def __iter__(self) -> Iterator[BufferRowView]:
+        frame_buffer = self._frame_buffer
+        return (BufferRowView(frame_buffer, row) for row in range(frame_buffer.height))
+
+    def __repr__(self) -> str:
+        return repr([list(row) for row in self])
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, BufferView | list | tuple):
+            return [list(row) for row in self] == [list(row) for row in other]
+        return NotImplemented
+
+    @overload
+    def __getitem__(self, key: int) -> BufferRowView: ...
+    @overload
+    def __getitem__(self, key: slice) -> list[BufferRowView]: ...
+    def __getitem__(self, key: int | slice) -> BufferRowView | list[BufferRowView]:
+        if isinstance(key, slice):
+            return list(self)[key]
+        height = self._frame_buffer.height
+        if key < 0:
+            key += height
+        if not 0 <= key < height:
+            raise IndexError("Buffer index out of range")
+        return BufferRowView(self._frame_buffer, key)
+
+    def __setitem__(
+        self,
+        key: int,
+        value: Iterable[tuple[Char, ColorValue | None]],
+    ) -> None:
+        self[key][:] = value
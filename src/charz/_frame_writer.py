@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from threading import Condition, Thread
+from typing import Callable
+
+
+class FrameWriter:
+    """`FrameWriter` class, writing formatted frames on a background thread.
+
+    Frames are handed over through a double buffer, made of the frame
+    being written and a single pending frame. If the writer is still busy
+    when a new frame is submitted, the pending frame is replaced,
+    so the main loop never waits on a slow terminal, and never falls behind.
+
+    `NOTE` Only the newest frame is guaranteed to be written,
+    so frames that depend on the previous one (like diffs) should only be
+    submitted when `has_pending` is `False`.
+
+    Attributes:
+        `dropped_count`: `int` - Number of pending frames replaced before written.
+    """
+
+    def __init__(self, write: Callable[[str], None]) -> None:
+        """Initialize and start writer thread.
+
+        Args:
+            write (Callable[[str], None]): Function writing a single frame,
+                called from the writer thread.
+        """
+        self.dropped_count = 0
+        self._write = write
+        self._condition = Condition()
+        self._pending: str | None = None
+        self._is_closing = False
+        self._error: BaseException | None = None
+        self._thread = Thread(target=self._run, name="charz-frame-writer", daemon=True)
+        self._thread.start()
+
+    def __repr__(self) -> str:
+        return (
+            self.__class__.__name__
+            + f"(alive={self._thread.is_alive()}, dropped={self.dropped_count})"
+        )
+
+    @property
+    def has_pending(self) -> bool:
+        """Whether a frame is waiting to be written.
+
+        Returns:
+            bool: `True` if the next submitted frame would replace a pending frame.
+        """
+        return self._pending is not None
+
+    def submit(self, frame: str, /) -> None:
+        """Hand frame over to the writer thread, replacing any pending frame.
+
+        Args:
+            frame (str): Formatted frame.
+
+        Raises:
+            RuntimeError: If the writer is closed.
+            BaseException: Error raised by `write` on the writer thread, if any.
+        """
+        self._raise_error()
+        with self._condition:
+            if self._is_closing:
+                raise RuntimeError(f"{self!r} is closed")
+            if self._pending is not None:
+                self.dropped_count += 1
+            self._pending = frame
+            self._condition.notify()
+
+    def close(self) -> None:
+        """Write pending frame, then stop writer thread and wait for it to finish.
+
+        Raises:
+            BaseException: Error raised by `write` on the writer thread, if any.
+        """
+        with self._condition:
+            self._is_closing = True
+            self._condition.notify()
+        self._thread.join()
+        self._raise_error()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._pending is None and not self._is_closing:
+                    self._condition.wait()
+                if self._pending is None:  # Closing, with nothing left to write
+                    return
+                frame = self._pending
+                self._pending = None
+            try:
+                self._write(frame)
+            except BaseException as error:
+                # Raised again on the main thread, by `submit` or `close`
+                self._error = error
+                with self._condition:
+                    self._is_closing = True
+                    self._pending = None
+                return
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error = self._error
+            self._error = None
+            raise error
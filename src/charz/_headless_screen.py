@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import os
+from itertools import groupby
+from typing import TYPE_CHECKING, NamedTuple, Sequence
+
+from colex import ColorValue
+
+from ._screen import Screen, _build_frame
+from ._annotations import Char
+
+if TYPE_CHECKING:
+    from ._recorder import Recorder
+    from ._viewport import Viewport
+
+
+class ScreenSnapshot(NamedTuple):
+    """Compact copy of a rendered frame, made by `HeadlessScreen.snapshot`.
+
+    Characters are stored as one `str` per row, and colors are stored
+    as runs of `(color, length)` per row, so uniform rows stay small.
+    Snapshots compare equal if their frames look the same.
+
+    Example:
+
+    ```python
+    snapshot = screen.snapshot()
+    assert snapshot.rows[0] == "##  "
+    assert snapshot.color_runs[0] == ((colex.RED, 2), (None, 2))
+    ```
+    """
+
+    rows: tuple[str, ...]
+    color_runs: tuple[tuple[tuple[ColorValue | None, int], ...], ...]
+
+    def __str__(self) -> str:
+        return "\n".join(self.rows)
+
+
+class HeadlessScreen(Screen):
+    """`HeadlessScreen` class, rendering frames without a terminal.
+
+    Texture nodes are still rendered into the screen buffer,
+    but nothing is encoded or written, and the terminal is never queried.
+    Frames can instead be encoded on demand with `encode`,
+    or copied with `snapshot`.
+
+    Useful for servers, tests and for benchmarking `render_all`
+    separately from terminal output.
+
+    Example:
+
+    ```python
+    from charz import Engine, HeadlessScreen
+
+    class Simulation(Engine):
+        screen = HeadlessScreen(width=80, height=24)
+    ```
+
+    Methods:
+        `encode`
+        `snapshot`
+    """
+
+    def __init__(
+        self,
+        width: int = 16,
+        height: int = 12,
+        *,
+        transparency_fill: Char = " ",
+        recorder: Recorder | None = None,
+        viewports: Sequence[Viewport] | None = None,
+    ) -> None:
+        """Initialize headless screen with given width and height.
+
+        Options of `Screen` for terminal output are left out,
+        as nothing is written.
+
+        Args:
+            width (NonNegative[int]): Width of the screen in characters.
+            height (NonNegative[int]): Height of the screen in characters.
+            transparency_fill (Char): Character used for transparent pixels.
+                Defaults to `" "`.
+            recorder (Recorder | None): Recorder that each frame is passed to,
+                like for recording to an asciicast file. Defaults to `None`.
+            viewports (Sequence[Viewport] | None): Rectangles of the screen,
+                each rendered from its own camera. Defaults to `None`,
+                which renders the whole screen from `Camera.current`.
+
+        Raises:
+            ValueError: If `transparency_fill` is not a `str` of length `1`.
+        """
+        super().__init__(
+            width,
+            height,
+            initial_clear=False,
+            final_clear=False,
+            hide_cursor=False,
+            transparency_fill=transparency_fill,
+            color_choice=Screen.COLOR_CHOICE_NEVER,
+            recorder=recorder,
+            viewports=viewports,
+        )
+
+    def on_startup(self) -> None:
+        """Startup hook, which does nothing, as there is no terminal to set up."""
+
+    def on_cleanup(self) -> None:
+        """Cleanup hook, only closing `recorder`, if set."""
+        if self.recorder is not None and not self.recorder.closed:
+            self.recorder.close()
+
+    def show(self) -> None:
+        """Skip showing the frame, only passing it to `recorder`, if set."""
+        if self.recorder is not None:
+            self.recorder.record(self)
+
+    def encode(self, *, ansi: bool = True) -> str:
+        """Encode the current frame, like it would be written to a terminal.
+
+        Args:
+            ansi (bool): Whether to include ANSI color and cursor codes.
+                Defaults to `True`.
+
+        Returns:
+            str: Formatted frame.
+        """
+        frame_buffer = self._frame_buffer
+        return _build_frame(frame_buffer, frame_buffer.width, frame_buffer.height, ansi)
+
+    def snapshot(self) -> ScreenSnapshot:
+        """Copy the current frame into a compact snapshot.
+
+        Returns:
+            ScreenSnapshot: Rows of characters, and runs of colors per row.
+        """
+        frame_buffer = self._frame_buffer
+        chars = frame_buffer.chars
+        colors = frame_buffer.colors
+        palette = frame_buffer.palette
+        width = frame_buffer.width
+        row_starts = range(0, frame_buffer.height * width, width)
+        return ScreenSnapshot(
+            rows=tuple(
+                "".join(chars[row_start : row_start + width]) for row_start in row_starts
+            ),
+            color_runs=tuple(
+                tuple(
+                    (palette[color_id], len(list(run)))
+                    for color_id, run in groupby(colors[row_start : row_start + width])
+                )
+                for row_start in row_starts
+            ),
+        )
+
+    def _get_terminal_state(self) -> tuple[os.terminal_size | None, bool]:
+        return (None, False)  # Never a terminal
@@ -61,6 +61,7 @@ class AnimatedSprite(AnimatedComponent, Sprite):
         centered: bool | None = None,
         z_index: int | None = None,
         transparency: Char | None = None,
+        static: bool | None = None,
         color: ColorValue | None = None,
         animations: AnimationSet | None = None,
         repeat: bool | None = None,
@@ -76,6 +77,7 @@ class AnimatedSprite(AnimatedComponent, Sprite):
             centered=centered,
             z_index=z_index,
             transparency=transparency,
+            static=static,
             color=color,
         )
         if animations is not None:
@@ -78,6 +78,7 @@ class Label(Sprite):
         centered: bool | None = None,
         z_index: int | None = None,
         transparency: Char | None = None,
+        static: bool | None = None,
         color: ColorValue | None = None,
         text: str | None = None,
         newline: Char | None = None,
@@ -96,6 +97,7 @@ class Label(Sprite):
             centered=centered,
             z_index=z_index,
             transparency=transparency,
+            static=static,
             color=color,
         )
         if text is not None:
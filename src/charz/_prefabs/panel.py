@@ -45,6 +45,7 @@ class Panel(Sprite):
         centered: bool | None = None,
         z_index: int | None = None,
         transparency: Char | None = None,
+        static: bool | None = None,
         color: ColorValue | None = None,
         width: int | None = None,
         height: int | None = None,
@@ -60,6 +61,7 @@ class Panel(Sprite):
             centered=centered,
             z_index=z_index,
             transparency=transparency,
+            static=static,
             color=color,
         )
         if width is not None:
@@ -47,6 +47,7 @@ class Sprite(ColorComponent, TextureComponent, charz_core.Node2D):
         centered: bool | None = None,
         z_index: int | None = None,
         transparency: Char | None = None,
+        static: bool | None = None,
         color: ColorValue | None = None,
     ) -> None:
         charz_core.Node2D.__init__(
@@ -66,6 +67,8 @@ class Sprite(ColorComponent, TextureComponent, charz_core.Node2D):
             self.z_index = z_index
         if transparency is not None:
             self.transparency = transparency
+        if static is not None:
+            self.static = static
         if color is not None:
             self.color = color
 
@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+from array import array
+from typing import Any
+
+from colex import ColorValue
+from charz_core import Node, Self, Vec2, Vec2i
+
+from .sprite import Sprite
+from .._annotations import Char
+
+
+class TileMap(Sprite):
+    """`TileMap` node for drawing large grids of tiles.
+
+    Each cell of the grid stores a tile id, which is mapped to a small texture
+    of size `tile_size` in the tile set. Cells are stored in square chunks
+    of `chunk_size` cells, and each chunk is rasterized into rows of text once,
+    then cached until one of its cells changes. When rendered,
+    only chunks inside the viewport are drawn, so large maps cost about
+    the same to draw as small maps.
+
+    Empty cells are filled with `transparency` if set, else with spaces.
+
+    `NOTE` Tile maps are drawn without rotation and centering,
+    with cell `(0, 0)` at the position of the node.
+
+    Example:
+
+    ```python
+    from charz import TileMap, Vec2i
+
+    class Level(TileMap):
+        tile_size = Vec2i(2, 1)
+        tile_set = {
+            1: ["##"],
+            2: ["~~"],
+        }
+
+    level = Level()
+    for x in range(1000):
+        level.set_cell(Vec2i(x, 0), 1)
+    ```
+
+    Attributes:
+        `tile_size`: `Vec2i` - Size of each tile texture, in characters.
+        `chunk_size`: `int` - Width and height of each chunk, in cells.
+        `tile_set`: `dict[int, list[str]]` - Initial tile textures per tile id,
+            added with `set_tile` when an instance is created.
+
+    Methods:
+        `set_tile`
+        `get_tile`
+        `set_cell`
+        `get_cell`
+        `erase_cell`
+        `clear`
+        `get_used_cells`
+    """
+
+    EMPTY: int = -1  # Tile id of empty cells
+    tile_size: Vec2i = Vec2i(1, 1)
+    chunk_size: int = 16
+    tile_set: dict[int, list[str]]
+    _tiles: dict[int, list[str]]
+    _chunks: dict[tuple[int, int], _Chunk]
+    # Bumped each time the drawn content changes, used for caching
+    _revision: int = 0
+    _transparency: Char | None = None
+    _watched_attributes = (*Sprite._watched_attributes, "transparency")
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Self:
+        instance = super().__new__(cls, *args, **kwargs)
+        instance._tiles = {}
+        instance._chunks = {}
+        for tile_id, texture in getattr(instance, "tile_set", {}).items():
+            instance.set_tile(tile_id, texture)
+        return instance
+
+    def __init__(
+        self,
+        parent: Node | None = None,
+        *,
+        position: Vec2 | None = None,
+        top_level: bool | None = None,
+        visible: bool | None = None,
+        z_index: int | None = None,
+        transparency: Char | None = None,
+        static: bool | None = None,
+        color: ColorValue | None = None,
+    ) -> None:
+        Sprite.__init__(
+            self,
+            parent=parent,
+            position=position,
+            top_level=top_level,
+            visible=visible,
+            z_index=z_index,
+            transparency=transparency,
+            static=static,
+            color=color,
+        )
+
+    @property
+    def transparency(self) -> Char | None:
+        """Character used to signal transparency, also filling empty cells."""
+        return self._transparency
+
+    @transparency.setter
+    def transparency(self, value: Char | None) -> None:
+        self._transparency = value
+        self._revision += 1  # Changes what empty cells are filled with
+
+    def set_tile(self, tile_id: int, texture: list[str], /) -> None:
+        """Add or replace tile texture in the tile set.
+
+        Args:
+            tile_id (int): Tile id, which is not `EMPTY`.
+            texture (list[str]): Texture of tile, with size `tile_size`.
+
+        Raises:
+            ValueError: If `tile_id` is `EMPTY`, or the size of `texture`
+                does not match `tile_size`.
+        """
+        if tile_id == self.EMPTY:
+            raise ValueError(f"Tile id {tile_id} is reserved for empty cells")
+        tile_width, tile_height = self.tile_size
+        if len(texture) != tile_height or any(
+            len(line) != tile_width for line in texture
+        ):
+            raise ValueError(
+                f"Tile {tile_id} texture does not match tile size"
+                f" {tile_width}x{tile_height}"
+            )
+        self._tiles[tile_id] = texture.copy()
+        for chunk in self._chunks.values():
+            chunk.rows = None
+        self._revision += 1
+
+    def get_tile(self, tile_id: int, /) -> list[str]:
+        """Get tile texture from the tile set.
+
+        Args:
+            tile_id (int): Tile id.
+
+        Returns:
+            list[str]: Copy of tile texture.
+
+        Raises:
+            KeyError: If tile id is not in the tile set.
+        """
+        return self._tiles[tile_id].copy()
+
+    def set_cell(self, cell: Vec2i | tuple[int, int], tile_id: int, /) -> None:
+        """Set tile id of cell.
+
+        Args:
+            cell (Vec2i | tuple[int, int]): Grid coordinates of cell.
+            tile_id (int): Tile id in the tile set, or `EMPTY`.
+
+        Raises:
+            KeyError: If tile id is not in the tile set, and is not `EMPTY`.
+        """
+        if tile_id != self.EMPTY and tile_id not in self._tiles:
+            raise KeyError(f"Tile id {tile_id} is not in tile set")
+        chunk_key, index = self._locate(cell)
+        chunk = self._chunks.get(chunk_key)
+        if chunk is None:
+            if tile_id == self.EMPTY:
+                return
+            chunk = self._chunks[chunk_key] = _Chunk(self.chunk_size)
+        if chunk.cells[index] == tile_id:
+            return
+        chunk.used_count += (tile_id != self.EMPTY) - (chunk.cells[index] != self.EMPTY)
+        chunk.cells[index] = tile_id
+        chunk.rows = None
+        if not chunk.used_count:
+            del self._chunks[chunk_key]
+        self._revision += 1
+
+    def get_cell(self, cell: Vec2i | tuple[int, int], /) -> int:
+        """Get tile id of cell.
+
+        Args:
+            cell (Vec2i | tuple[int, int]): Grid coordinates of cell.
+
+        Returns:
+            int: Tile id, or `EMPTY`.
+        """
+        chunk_key, index = self._locate(cell)
+        chunk = self._chunks.get(chunk_key)
+        if chunk is None:
+            return self.EMPTY
+        return chunk.cells[index]
+
+    def erase_cell(self, cell: Vec2i | tuple[int, int], /) -> None:
+        """Set cell to `EMPTY`.
+
+        Args:
+            cell (Vec2i | tuple[int, int]): Grid coordinates of cell.
+        """
+        self.set_cell(cell, self.EMPTY)
+
+    def clear(self) -> None:
+        """Set every cell to `EMPTY`."""
+        self._chunks.clear()
+        self._revision += 1
+
+    def get_used_cells(self) -> list[Vec2i]:
+        """Get grid coordinates of every cell that is not `EMPTY`.
+
+        Returns:
+            list[Vec2i]: Coordinates of used cells.
+        """
+        size = self.chunk_size
+        return [
+            Vec2i(chunk_x * size + index % size, chunk_y * size + index // size)
+            for (chunk_x, chunk_y), chunk in self._chunks.items()
+            for index, tile_id in enumerate(chunk.cells)
+            if tile_id != self.EMPTY
+        ]
+
+    def get_chunk_rows(self, chunk_key: tuple[int, int], /) -> list[str] | None:
+        """Get rasterized rows of chunk, rasterizing it if not cached.
+
+        Args:
+            chunk_key (tuple[int, int]): Chunk coordinates,
+                which is cell coordinates floor divided by `chunk_size`.
+
+        Returns:
+            list[str] | None: Rows of text covering the chunk,
+                or `None` if every cell in the chunk is `EMPTY`.
+        """
+        chunk = self._chunks.get(chunk_key)
+        if chunk is None:
+            return None
+        fill = self.transparency if self.transparency is not None else " "
+        if chunk.rows is None or chunk.fill != fill:
+            chunk.rows = self._rasterize(chunk, fill)
+            chunk.fill = fill
+        return chunk.rows
+
+    def _locate(self, cell: Vec2i | tuple[int, int]) -> tuple[tuple[int, int], int]:
+        cell_x, cell_y = cell
+        chunk_x, local_x = divmod(int(cell_x), self.chunk_size)
+        chunk_y, local_y = divmod(int(cell_y), self.chunk_size)
+        return ((chunk_x, chunk_y), local_y * self.chunk_size + local_x)
+
+    def _rasterize(self, chunk: _Chunk, fill: Char) -> list[str]:
+        tile_width, tile_height = self.tile_size
+        size = self.chunk_size
+        tiles = self._tiles
+        empty_line = fill * tile_width
+        rows: list[str] = []
+        for row_start in range(0, size * size, size):
+            tile_textures = [
+                tiles[tile_id] if tile_id != self.EMPTY else None
+                for tile_id in chunk.cells[row_start : row_start + size]
+            ]
+            rows.extend(
+                "".join(
+                    texture[line_index] if texture is not None else empty_line
+                    for texture in tile_textures
+                )
+                for line_index in range(tile_height)
+            )
+        return rows
+
+
+class _Chunk:
+    """Square chunk of cells in `TileMap`, with its cached rasterized rows."""
+
+    __slots__ = ("cells", "fill", "rows", "used_count")
+
+    def __init__(self, size: int) -> None:
+        self.cells = array("i", [TileMap.EMPTY]) * (size * size)
+        self.used_count = 0
+        self.rows: list[str] | None = None
+        self.fill: Char = " "
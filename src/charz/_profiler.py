@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+from collections import deque
+from functools import wraps
+from time import perf_counter_ns
+from typing import Any, Callable, NamedTuple
+from weakref import WeakSet
+
+from charz_core import Engine, Scene
+
+
+class TaskTimings(NamedTuple):
+    """Timings of a frame task, made by `Profiler.get_timings`.
+
+    All times are in seconds, and are computed from the samples
+    in the rolling window of the profiler.
+    """
+
+    count: int
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+class Profiler:
+    """`Profiler` class, timing each frame task of `Engine` and `Scene`.
+
+    When enabled, every task in `Engine.frame_tasks` and `Scene.frame_tasks`
+    is replaced with a wrapper recording its duration with `perf_counter_ns`.
+    Only the last `window` durations of each task are kept,
+    so the timings reflect recent frames. When disabled,
+    the original tasks are put back, so there is no overhead.
+
+    `NOTE` Tasks registered while enabled are not timed,
+    and time spent in `Scene` tasks is also part of `process_current_scene`.
+    Several profilers may be enabled at once, like for engines sharing
+    an event loop, and be disabled in any order.
+
+    Example:
+
+    ```python
+    from charz import Engine, Profiler
+
+    class MyGame(Engine):
+        profiler = Profiler()
+
+    game = MyGame()
+    game.run()
+    print(game.profiler.report())
+    ```
+
+    Attributes:
+        `window`: `int` - Number of durations kept per task.
+        `enabled`: `property[bool]` - Whether frame tasks are being timed.
+
+    Methods:
+        `enable`
+        `disable`
+        `reset`
+        `get_percentile`
+        `get_timings`
+        `report`
+    """
+
+    def __init__(self, *, window: int = 600) -> None:
+        """Initialize profiler with empty timings.
+
+        Args:
+            window (int, optional): Number of durations kept per task.
+                Defaults to `600`.
+
+        Raises:
+            ValueError: If `window` is less than `1`.
+        """
+        if window < 1:
+            raise ValueError(f"Parameter 'window' must be at least 1, got {window}")
+        self.window = window
+        self._samples: dict[str, deque[int]] = {}
+        self._wrappers: list[tuple[dict[int, Any], int, Callable[..., None]]] = []
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(window={self.window}, enabled={self.enabled})"
+
+    @property
+    def enabled(self) -> bool:
+        """Whether frame tasks are being timed.
+
+        Returns:
+            bool: `True` if enabled, `False` otherwise.
+        """
+        return bool(self._wrappers)
+
+    def enable(self) -> None:
+        """Start timing frame tasks of `Engine` and `Scene`."""
+        if self.enabled:
+            return
+        for owner in (Engine, Scene):
+            frame_tasks = owner.frame_tasks
+            for priority, frame_task in list(frame_tasks.items()):
+                name = f"{owner.__name__}.{frame_task.__name__}"
+                samples = self._samples.setdefault(name, deque(maxlen=self.window))
+                wrapper = _time_frame_task(frame_task, samples)
+                frame_tasks[priority] = wrapper
+                self._wrappers.append((frame_tasks, priority, wrapper))
+
+    def disable(self) -> None:
+        """Stop timing frame tasks, putting back the original tasks."""
+        for frame_tasks, priority, wrapper in self._wrappers:
+            _remove_wrapper(frame_tasks, priority, wrapper)
+        self._wrappers.clear()
+
+    def reset(self) -> None:
+        """Clear recorded durations of every task."""
+        for samples in self._samples.values():
+            samples.clear()
+
+    def get_percentile(self, task_name: str, percentile: float, /) -> float:
+        """Get percentile of recorded durations of a frame task.
+
+        Args:
+            task_name (str): Name of task, like `"Engine.refresh_screen"`.
+            percentile (float): Percentile in range `[0, 100]`.
+
+        Returns:
+            float: Duration in seconds.
+
+        Raises:
+            KeyError: If no durations are recorded for the task.
+            ValueError: If `percentile` is not in range `[0, 100]`.
+        """
+        if not 0 <= percentile <= 100:  # noqa: PLR2004
+            raise ValueError(f"Percentile must be in range [0, 100], got {percentile}")
+        samples = self._samples.get(task_name)
+        if not samples:
+            raise KeyError(f"No durations recorded for task {task_name!r}")
+        return _nearest_rank(sorted(samples), percentile) / 1e9
+
+    def get_timings(self) -> dict[str, TaskTimings]:
+        """Get timings of every frame task with recorded durations.
+
+        Returns:
+            dict[str, TaskTimings]: Timings per task name, like `"Scene.update_nodes"`.
+        """
+        timings: dict[str, TaskTimings] = {}
+        for name, samples in self._samples.items():
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            timings[name] = TaskTimings(
+                count=len(ordered),
+                mean=sum(ordered) / len(ordered) / 1e9,
+                p50=_nearest_rank(ordered, 50) / 1e9,
+                p95=_nearest_rank(ordered, 95) / 1e9,
+                p99=_nearest_rank(ordered, 99) / 1e9,
+                max=ordered[-1] / 1e9,
+            )
+        return timings
+
+    def report(self) -> str:
+        """Format timings of every frame task as a table, slowest first.
+
+        Returns:
+            str: Table with times in milliseconds.
+        """
+        timings = sorted(
+            self.get_timings().items(),
+            key=lambda item: item[1].p95,
+            reverse=True,
+        )
+        width = max((len(name) for name, _ in timings), default=4)
+        header = f"{'task':<{width}} {'count':>6}" + "".join(
+            f" {field:>8}" for field in TaskTimings._fields[1:]
+        )
+        lines = [header]
+        lines.extend(
+            f"{name:<{width}} {task_timings.count:>6}"
+            + "".join(f" {seconds * 1e3:>8.3f}" for seconds in task_timings[1:])
+            for name, task_timings in timings
+        )
+        return "\n".join(lines)
+
+
+# Wrappers made by any profiler, which may wrap wrappers of other profilers
+_timed_frame_tasks: WeakSet[Callable[[Any], None]] = WeakSet()
+
+
+def _time_frame_task(
+    frame_task: Callable[[Any], None],
+    samples: deque[int],
+) -> Callable[[Any], None]:
+    append = samples.append
+
+    @wraps(frame_task)
+    def timed_frame_task(owner: Any) -> None:  # noqa: ANN401
+        start = perf_counter_ns()
+        # NOTE: Looked up on each call, as it is replaced when an inner wrapper
+        #       of another profiler is removed
+        timed_frame_task.__wrapped__(owner)  # type: ignore[attr-defined]
+        append(perf_counter_ns() - start)
+
+    _timed_frame_tasks.add(timed_frame_task)
+    return timed_frame_task
+
+
+def _remove_wrapper(
+    frame_tasks: dict[int, Any],
+    priority: int,
+    wrapper: Callable[[Any], None],
+) -> None:
+    # Put back the task that `wrapper` wraps, either directly in `frame_tasks`,
+    # or in the wrapper of another profiler, that was enabled later
+    wrapped = wrapper.__wrapped__  # type: ignore[attr-defined]
+    frame_task = frame_tasks.get(priority)
+    if frame_task is wrapper:
+        frame_tasks[priority] = wrapped
+        return
+    while frame_task in _timed_frame_tasks:
+        if frame_task.__wrapped__ is wrapper:  # type: ignore[union-attr]
+            frame_task.__wrapped__ = wrapped  # type: ignore[union-attr]
+            return
+        frame_task = frame_task.__wrapped__  # type: ignore[union-attr]
+    # Otherwise, the task was replaced while enabled, so it is left as is
+
+
+def _nearest_rank(ordered: list[int], percentile: float) -> int:
+    index = max(0, -(-len(ordered) * percentile // 100) - 1)  # Ceiling division
+    return ordered[int(index)]
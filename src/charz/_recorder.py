@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import os
+import json
+import time
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+from charz_core import Self
+
+from ._frame_buffer import FrameBuffer
+from ._screen import ConsoleCode, _build_frame, _build_frame_diff
+
+if TYPE_CHECKING:
+    from ._screen import Screen
+
+
+# Size of the write buffer, so events are written to disk in larger chunks
+_WRITE_BUFFER_SIZE: int = 64 * 1024
+
+
+class Recorder:
+    """`Recorder` class, recording frames of a `Screen` to an asciicast v2 file.
+
+    Each recorded frame is written as an output event, with the time since
+    the recorder was created. Only the cells that changed since the previous
+    frame are written, and frames without changes are skipped.
+    Events are streamed to the file through a write buffer,
+    so memory use does not grow with the length of the recording.
+
+    The file can be replayed with `asciinema play <file>`,
+    or any other player supporting asciicast v2.
+
+    `NOTE` The header is written when the first frame is recorded,
+    since the size of the frame is not known before that.
+
+    Example:
+
+    ```python
+    from charz import Engine, Screen, Recorder
+
+    class MyGame(Engine):
+        screen = Screen(recorder=Recorder("session.cast"))
+    ```
+
+    Attributes:
+        `path`: `str | os.PathLike[str]` - Path of the recording.
+        `title`: `str | None` - Title stored in the header.
+        `frame_count`: `int` - Number of frames written.
+        `closed`: `property[bool]` - Whether the file is closed.
+
+    Methods:
+        `record`
+        `close`
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        title: str | None = None,
+    ) -> None:
+        """Open file for recording, replacing any existing file.
+
+        Args:
+            path (str | os.PathLike[str]): Path of the recording.
+            title (str | None): Title stored in the header. Defaults to `None`.
+        """
+        self.path = path
+        self.title = title
+        self.frame_count = 0
+        self._file = open(  # noqa: SIM115
+            path,
+            "w",
+            encoding="utf-8",
+            newline="\n",
+            buffering=_WRITE_BUFFER_SIZE,
+        )
+        self._start_time = time.perf_counter()
+        self._previous_frame: FrameBuffer | None = None
+        self._size: tuple[int, int] | None = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.path!r}, frames={self.frame_count})"
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        """Whether the file is closed.
+
+        Returns:
+            bool: `True` if closed, `False` otherwise.
+        """
+        return self._file.closed
+
+    def record(self, screen: Screen, /) -> None:
+        """Record current content of the screen buffer.
+
+        A full frame is written for the first frame, and after the frame
+        has been resized, along with a resize event. Other frames only
+        write the cells that changed since the previous recorded frame.
+
+        Args:
+            screen (Screen): Screen to record the buffer of.
+        """
+        frame_buffer = screen._frame_buffer
+        size = (frame_buffer.width, frame_buffer.height)
+        elapsed = time.perf_counter() - self._start_time
+        previous_frame = self._previous_frame
+        # NOTE: Output is stored as written by the terminal, after it has turned
+        #       each `"\n"` into `"\r\n"`, so rows must start at the first column
+        if self._size is None:
+            self._write_header(*size)
+            out = _build_frame(frame_buffer, *size, True, newline="\r\n")
+        elif size != self._size:
+            self._write_event(elapsed, "r", f"{size[0]}x{size[1]}")
+            out = ConsoleCode.CLEAR + _build_frame(
+                frame_buffer, *size, True, newline="\r\n"
+            )
+        elif previous_frame is None or previous_frame.palette is not frame_buffer.palette:
+            out = _build_frame(frame_buffer, *size, True, newline="\r\n")
+        else:
+            out = _build_frame_diff(frame_buffer, previous_frame, *size)
+        self._size = size
+        self._previous_frame = frame_buffer.copy()
+        if out:
+            self._write_event(elapsed, "o", out)
+            self.frame_count += 1
+
+    def close(self) -> None:
+        """Flush remaining events and close the file."""
+        self._file.close()
+        self._previous_frame = None
+
+    def _write_header(self, width: int, height: int) -> None:
+        header: dict[str, Any] = {
+            "version": 2,
+            "width": width,
+            "height": height,
+            "timestamp": int(time.time()),
+            "env": {"TERM": os.environ.get("TERM", "xterm-256color")},
+        }
+        if self.title is not None:
+            header["title"] = self.title
+        self._file.write(json.dumps(header) + "\n")
+
+    def _write_event(self, elapsed: float, code: str, data: str) -> None:
+        self._file.write(json.dumps([round(elapsed, 6), code, data]) + "\n")
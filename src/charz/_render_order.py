@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from weakref import WeakKeyDictionary
+
+from charz_core import Scene
+
+from ._annotations import TextureNode
+
+
+class RenderList(tuple[TextureNode, ...]):
+    """`tuple` of texture nodes, already sorted by z-index.
+
+    Passing an instance to `Screen.render_all` skips sorting the nodes again.
+    """
+
+    __slots__ = ()
+
+
+class RenderOrder:
+    """`RenderOrder` class, keeping texture nodes of a scene sorted by z-index.
+
+    Nodes are stored in buckets per z-index, where each bucket keeps
+    creation order, so newer nodes are drawn on top of older nodes
+    with the same z-index. The flattened `RenderList` is cached,
+    and only rebuilt after a node is added, removed or changes z-index.
+    The same goes for the lists split by `TextureComponent.static`.
+
+    `NOTE` This is maintained by `TextureComponent`,
+    and by a `Scene` frame task that removes nodes queued for freeing.
+    """
+
+    __slots__ = (
+        "_buckets",
+        "_render_list",
+        "_static_render_list",
+        "_dynamic_render_list",
+    )
+
+    def __init__(self) -> None:
+        self._buckets: dict[int, dict[int, TextureNode]] = {}
+        self._render_list: RenderList | None = RenderList()
+        self._static_render_list: RenderList | None = RenderList()
+        self._dynamic_render_list: RenderList | None = RenderList()
+
+    def __len__(self) -> int:
+        return sum(map(len, self._buckets.values()))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self)})"
+
+    def add(self, node: TextureNode, /) -> None:
+        """Add node to the bucket of its current z-index.
+
+        Args:
+            node (TextureNode): Node to add.
+        """
+        bucket = self._buckets.setdefault(node.z_index, {})
+        is_newest = not bucket or node.uid > next(reversed(bucket))
+        bucket[node.uid] = node
+        if not is_newest:  # Restore creation order, which follows `uid`
+            self._buckets[node.z_index] = dict(sorted(bucket.items()))
+        self.invalidate()
+
+    def remove(self, node: TextureNode, /) -> None:
+        """Remove node, if present.
+
+        Args:
+            node (TextureNode): Node to remove.
+        """
+        self._remove(node, node.z_index)
+
+    def move(self, node: TextureNode, old_z_index: int, /) -> None:
+        """Move node from bucket of `old_z_index` to bucket of its current z-index.
+
+        Nodes not present, like nodes already freed, are not added back.
+
+        Args:
+            node (TextureNode): Node that changed z-index.
+            old_z_index (int): Z-index of node before it changed.
+        """
+        if self._remove(node, old_z_index):
+            self.add(node)
+
+    def invalidate(self) -> None:
+        """Mark cached render lists as outdated, so they are rebuilt on next use."""
+        self._render_list = None
+        self._static_render_list = None
+        self._dynamic_render_list = None
+
+    def get_render_list(self) -> RenderList:
+        """Get nodes sorted by z-index, rebuilt only if changed since last call.
+
+        Returns:
+            RenderList: Nodes sorted by z-index.
+        """
+        if self._render_list is None:
+            self._render_list = RenderList(
+                node
+                for z_index in sorted(self._buckets)
+                for node in self._buckets[z_index].values()
+            )
+        return self._render_list
+
+    def get_static_render_list(self) -> RenderList:
+        """Get nodes with `static` set, sorted by z-index.
+
+        Returns:
+            RenderList: Static nodes sorted by z-index.
+        """
+        if self._static_render_list is None:
+            self._static_render_list = RenderList(
+                node for node in self.get_render_list() if node.static
+            )
+        return self._static_render_list
+
+    def get_dynamic_render_list(self) -> RenderList:
+        """Get nodes without `static` set, sorted by z-index.
+
+        Returns:
+            RenderList: Dynamic nodes sorted by z-index.
+        """
+        if self._dynamic_render_list is None:
+            self._dynamic_render_list = RenderList(
+                node for node in self.get_render_list() if not node.static
+            )
+        return self._dynamic_render_list
+
+    def _remove(self, node: TextureNode, z_index: int) -> bool:
+        bucket = self._buckets.get(z_index)
+        if bucket is None or bucket.pop(node.uid, None) is None:
+            return False
+        if not bucket:
+            del self._buckets[z_index]
+        self.invalidate()
+        return True
+
+
+# Render order per scene, dropped together with the scene
+_render_orders: WeakKeyDictionary[Scene, RenderOrder] = WeakKeyDictionary()
+
+
+def get_render_order(scene: Scene, /) -> RenderOrder:
+    """Get render order of scene, creating it if not present.
+
+    Args:
+        scene (Scene): Scene owning the texture nodes.
+
+    Returns:
+        RenderOrder: Render order of scene.
+    """
+    render_order = _render_orders.get(scene)
+    if render_order is None:
+        render_order = _render_orders[scene] = RenderOrder()
+    return render_order
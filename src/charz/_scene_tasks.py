@@ -3,12 +3,22 @@ from __future__ import annotations
 from charz_core import Scene
 
 from ._grouping import Group
-from ._annotations import AnimatedNode
+from ._render_order import get_render_order
+from ._annotations import AnimatedNode, TextureNode
 
 
 # Define additional frame tasks for `Scene`
 
 
+def forget_queued_texture_nodes(current_scene: Scene) -> None:
+    """Remove texture nodes queued for freeing from the render order."""
+    texture_group = current_scene.groups[Group.TEXTURE]
+    render_order = get_render_order(current_scene)
+    for node_id in current_scene._queued_nodes:
+        if (node := texture_group.get(node_id)) is not None:
+            render_order.remove(node)  # type: ignore[arg-type]
+
+
 def progress_animations(current_scene: Scene) -> None:
     """Update animations for all animated nodes in the current scene."""
     for animated_node in current_scene.get_group_members(
@@ -19,4 +29,6 @@ def progress_animations(current_scene: Scene) -> None:
 
 
 # Register additional frame tasks for `Scene`
+# NOTE: Runs right before `free_queued_nodes` (priority 80) from `charz-core`
+Scene.frame_tasks[85] = forget_queued_texture_nodes
 Scene.frame_tasks[70] = progress_animations
@@ -1,18 +1,58 @@
 from __future__ import annotations
 
 import os
+import re
 import sys
-from math import cos, sin, floor
+import select
+from math import cos, sin, floor, tau as TAU
+from time import monotonic, perf_counter
+from functools import lru_cache
+from array import array
+from itertools import groupby
 from enum import Enum, unique, auto
-from typing import Sequence
+from typing import TYPE_CHECKING, NamedTuple, Sequence
 
 from colex import ColorValue, RESET
-from charz_core import Scene, Camera, TransformComponent, Vec2i
+from charz_core import Scene, Camera, TransformComponent, Vec2, Vec2i
 
 from . import text
-from ._components.texture import TextureComponent
-from ._grouping import Group
-from ._annotations import TextureNode, FileLike, Renderable, Char
+from ._components.texture import TextureComponent, get_texture_size
+from ._prefabs.tile_map import TileMap
+from ._render_order import RenderList, get_render_order
+from ._frame_buffer import FrameBuffer, BufferView, COLOR_ID_TYPECODE, NO_COLOR_ID
+from ._frame_writer import FrameWriter
+from ._terminal import ResizeSignal
+from ._viewport import Viewport
+from ._annotations import FileLike, Renderable, Char
+
+if TYPE_CHECKING:
+    from ._recorder import Recorder
+
+
+# Unchanged gaps shorter than this are rewritten instead of skipped with a cursor move,
+# since the move sequence (`"\r\x1b[<n>C"`) is about as long as the gap itself
+_DIFF_MERGE_GAP: int = 4
+# Rotations are quantized into this many steps per turn, when cached
+_ROTATION_STEPS: int = 4096
+_ROTATION_STEP_SIZE: float = TAU / _ROTATION_STEPS
+# Maximum number of rotated textures cached per screen
+_ROTATION_CACHE_SIZE: int = 1024
+# Seconds between terminal size checks, when resizes are not reported by `SIGWINCH`
+_TERMINAL_POLL_INTERVAL: float = 0.5
+
+
+class RotatedCells(NamedTuple):
+    """Opaque cells of a rotated texture, with the bounds of their offsets.
+
+    Each cell is stored as `(x_offset, y_offset, rotated_char)`,
+    relative to the position of the node.
+    """
+
+    cells: list[tuple[float, float, Char]]
+    min_x: float
+    min_y: float
+    max_x: float
+    max_y: float
 
 
 @unique
@@ -66,9 +106,10 @@ class Screen(metaclass=ScreenClassProperties):
     Attributes:
         `stream`: `FileLike[str]` - Output stream written to.
             Defaults to `sys.stdout`.
-        `buffer`: `list[list[tuple[Char, ColorValue | None]]]` - Screen buffer,
-            where each pixel is stored in a 2D `list`,
+        `buffer`: `property[BufferView]` - View of the screen buffer,
+            where each pixel is accessed like a 2D `list` (`buffer[y][x]`),
             and each pixel is a `tuple` pair of visual character and optional color.
+            The cells are stored in flat arrays, with colors interned as small ids.
         `width`: `NonNegative[int]` - Viewport width in character pixels.
         `height`: `NonNegative[int]` - Viewport height in character pixels.
         `size`: `property[Vec2i]` - Read-only getter,
@@ -81,6 +122,20 @@ class Screen(metaclass=ScreenClassProperties):
         `color_choice`: `ColorChoice` - How colors are handled.
         `margin_right`: `int` - Margin on right side to not draw on.
         `margin_bottom`: `int` - Margin under to not draw on.
+        `diff_output`: `bool` - Whether to only write cells that changed since
+            the previous frame, instead of redrawing the whole frame.
+        `byte_output`: `bool` - Whether to write frames as bytes directly
+            to the file descriptor of `stream`, with a single system call.
+        `threaded_output`: `bool` - Whether to write frames on a background thread,
+            started by `on_startup` and stopped by `on_cleanup`.
+        `recorder`: `Recorder | None` - Recorder that shown frames are passed to,
+            which is closed by `on_cleanup`.
+        `refresh_time`: `float` - Seconds spent in the last call to `refresh`.
+        `max_palette_size`: `int` - Number of interned colors allowed
+            before `refresh` starts over with an empty palette,
+            which causes a full redraw. Colors are only freed then.
+        `viewports`: `list[Viewport]` - Rectangles rendered from their own camera.
+            If empty, the whole screen is rendered from `Camera.current`.
 
     Hooks:
         `on_startup`
@@ -96,7 +151,7 @@ class Screen(metaclass=ScreenClassProperties):
     """
 
     stream: FileLike[str] = sys.stdout
-    buffer: list[list[tuple[Char, ColorValue | None]]]
+    max_palette_size: int = 4096
 
     def __init__(
         self,
@@ -112,6 +167,11 @@ class Screen(metaclass=ScreenClassProperties):
         stream: FileLike[str] | None = None,
         margin_right: int = 1,
         margin_bottom: int = 1,
+        diff_output: bool = False,
+        byte_output: bool = False,
+        threaded_output: bool = False,
+        recorder: Recorder | None = None,
+        viewports: Sequence[Viewport] | None = None,
     ) -> None:
         """Initialize screen with given width and height.
 
@@ -136,6 +196,21 @@ class Screen(metaclass=ScreenClassProperties):
                 Defaults to `1`.
             margin_bottom (int): Bottom margin in characters.
                 Defaults to `1`.
+            diff_output (bool): Whether to only write changed cells,
+                using cursor movement to skip unchanged parts.
+                Only applies when using ANSI codes. Defaults to `False`.
+            byte_output (bool): Whether to encode frames into bytes,
+                written with `os.write` to the file descriptor of `stream`.
+                Falls back to writing text to `stream`,
+                if it has no file descriptor. Defaults to `False`.
+            threaded_output (bool): Whether to hand frames over to a writer thread,
+                so `show` does not block on slow terminals. If the writer is busy,
+                the newest frame replaces the pending frame. Defaults to `False`.
+            recorder (Recorder | None): Recorder that each shown frame is passed to,
+                like for recording to an asciicast file. Defaults to `None`.
+            viewports (Sequence[Viewport] | None): Rectangles of the screen,
+                each rendered from its own camera. Defaults to `None`,
+                which renders the whole screen from `Camera.current`.
 
         Raises:
             ValueError: If `transparency_fill` is not a `str` of length `1`.
@@ -156,10 +231,37 @@ class Screen(metaclass=ScreenClassProperties):
         self.initial_clear = initial_clear
         self.final_clear = final_clear
         self.hide_cursor = hide_cursor
+        self.diff_output = diff_output
+        self.byte_output = byte_output
+        self.threaded_output = threaded_output
+        self.recorder = recorder
+        # Cached layer of static nodes, valid while key and textures are unchanged
+        self._static_layer: FrameBuffer | None = None
+        self._static_layer_key: list[tuple[object, ...]] = []
+        self._static_layer_textures: list[list[str]] = []
+        self.viewports: list[Viewport] = list(viewports or ())
+        # Rectangle that rendering is clipped to, as `(left, top, right, bottom)`
+        self._clip: tuple[int, int, int, int] = (0, 0, 0, 0)
+        # Measured by `refresh`, used by `Engine` to decide when to skip frames
+        self.refresh_time: float = 0
+        # Running between `on_startup` and `on_cleanup`, if `threaded_output`
+        self._frame_writer: FrameWriter | None = None
+        # Terminal state of `_terminal_stream`, updated by `_update_terminal_state`
+        self._terminal_stream: FileLike[str] | None = None
+        self._terminal_size: os.terminal_size | None = None
+        self._is_a_tty: bool = False
+        self._terminal_resize_count: int = 0
+        self._terminal_checked_at: float = 0
+        # Frame currently visible in the terminal, used as base for `diff_output`
+        self._previous_frame: FrameBuffer | None = None
+        self._previous_size: tuple[int, int] = (0, 0)
+        self._rotation_cache: dict[
+            tuple[int, int, bool, Char | None],
+            tuple[list[str], RotatedCells],
+        ] = {}
         self._resize_if_necessary()
         self.transparency_fill = transparency_fill
-        self.buffer = []
-        self.reset_buffer()  # For populating the screen buffer
+        self._frame_buffer = FrameBuffer(self.width, self.height, transparency_fill)
 
     def on_startup(self) -> None:
         """Startup hook.
@@ -172,6 +274,9 @@ class Screen(metaclass=ScreenClassProperties):
         as long as they use a different type of filehandle (like sockets or files),
         though this is not recommended.
         """
+        self._previous_frame = None  # Terminal content is unknown, so redraw fully
+        # Terminal size is then only checked again after being resized
+        ResizeSignal.install()
         if self.is_using_ansi():
             if self.initial_clear:
                 self.stream.write(ConsoleCode.CLEAR)
@@ -179,6 +284,9 @@ class Screen(metaclass=ScreenClassProperties):
             if self.hide_cursor:
                 self.stream.write(CursorCode.HIDE)
                 self.stream.flush()
+        # NOTE: Started after the codes above are written, to keep them first
+        if self.threaded_output and self._frame_writer is None:
+            self._frame_writer = FrameWriter(self._write)
 
     def on_cleanup(self) -> None:
         """Cleanup hook.
@@ -187,6 +295,11 @@ class Screen(metaclass=ScreenClassProperties):
         The logic is seperated into this method,
         as only 1 screen (which normally uses `sys.stdout`) can be active at a time.
         """
+        # NOTE: Pending frame is written before the codes below
+        if self._frame_writer is not None:
+            frame_writer = self._frame_writer
+            self._frame_writer = None
+            frame_writer.close()
         if self.hide_cursor and self.is_using_ansi():
             self.stream.write(CursorCode.SHOW)
             self.stream.flush()
@@ -196,6 +309,8 @@ class Screen(metaclass=ScreenClassProperties):
             self.reset_buffer()
             self.show()
             self.transparency_fill = old_fill
+        if self.recorder is not None and not self.recorder.closed:
+            self.recorder.close()
 
     @property
     def auto_resize(self) -> bool:
@@ -221,23 +336,18 @@ class Screen(metaclass=ScreenClassProperties):
 
         This method checks if the screen should be resized based on the
         `auto_resize` property and the current terminal size.
-        If `auto_resize` is `True`, it attempts to get the terminal size
-        using `os.get_terminal_size(...)`.
-        If successful, it updates the screen dimensions accordingly.
+        If `auto_resize` is `True`, it uses the cached terminal size,
+        which is only updated after the terminal is resized.
+        If available, it updates the screen dimensions accordingly.
 
         `NOTE` Does not mutate screen `buffer`.
         """
         if self.auto_resize:
-            try:
-                fileno = self.stream.fileno()
-            except (ValueError, OSError):
+            terminal_size = self._get_terminal_state()[0]
+            if terminal_size is None:
                 # Do not resize if not proper `.stream.fileno()` is available,
                 # like `io.StringIO.fileno()`
                 return
-            try:
-                terminal_size = os.get_terminal_size(fileno)
-            except (ValueError, OSError):
-                return
             self.width = terminal_size.columns - self.margin_right
             self.height = terminal_size.lines - self.margin_bottom
 
@@ -281,15 +391,7 @@ class Screen(metaclass=ScreenClassProperties):
         """
         if self.color_choice is ColorChoice.ALWAYS:
             return True
-        try:
-            fileno = self.stream.fileno()
-        except (ValueError, OSError):
-            is_a_tty = False
-        else:
-            try:
-                is_a_tty = os.isatty(fileno)
-            except OSError:
-                is_a_tty = False
+        is_a_tty = self._get_terminal_state()[1]
         # Returns `False` if not a TTY or is `ColorChoice.NEVER`
         return self.color_choice is ColorChoice.AUTO and is_a_tty
 
@@ -306,33 +408,119 @@ class Screen(metaclass=ScreenClassProperties):
         Returns:
             Vec2i: Actual size of the screen, adjusted for terminal size and margins.
         """
+        terminal_size = self._get_terminal_state()[0]
+        if terminal_size is None:
+            return self.size.copy()
+        actual_width = min(self.width, terminal_size.columns - self.margin_right)
+        actual_height = min(self.height, terminal_size.lines - self.margin_bottom)
+        return Vec2i(actual_width, actual_height)
+
+    def _get_terminal_state(self) -> tuple[os.terminal_size | None, bool]:
+        """Get cached terminal size and TTY status of `stream`.
+
+        The cache is updated if `stream` was replaced, or if the terminal
+        was resized since last update, as counted by `ResizeSignal`.
+        If `ResizeSignal` is not installed, the cache is instead updated
+        at most every `_TERMINAL_POLL_INTERVAL` seconds.
+
+        Returns:
+            tuple[os.terminal_size | None, bool]: Terminal size,
+                or `None` if not available, and whether `stream` is a TTY.
+        """
+        if (
+            self.stream is not self._terminal_stream
+            or self._terminal_resize_count != ResizeSignal.count
+            or (
+                not ResizeSignal.is_installed
+                and monotonic() - self._terminal_checked_at >= _TERMINAL_POLL_INTERVAL
+            )
+        ):
+            self._update_terminal_state()
+        return (self._terminal_size, self._is_a_tty)
+
+    def _update_terminal_state(self) -> None:
+        """Update cached terminal size and TTY status, using system calls."""
+        self._terminal_stream = self.stream
+        # NOTE: Read before the calls below, so a resize during them is not missed
+        self._terminal_resize_count = ResizeSignal.count
+        self._terminal_checked_at = monotonic()
         try:
             fileno = self.stream.fileno()
         except (ValueError, OSError):
-            return self.size.copy()
+            self._terminal_size = None
+            self._is_a_tty = False
+            return
+        try:
+            self._is_a_tty = os.isatty(fileno)
+        except OSError:
+            self._is_a_tty = False
         try:
-            terminal_size = os.get_terminal_size(fileno)
+            self._terminal_size = os.get_terminal_size(fileno)
         except (ValueError, OSError):
-            return self.size.copy()
-        actual_width = min(self.width, terminal_size.columns - self.margin_right)
-        actual_height = min(self.height, terminal_size.lines - self.margin_bottom)
-        return Vec2i(actual_width, actual_height)
+            self._terminal_size = None
+
+    @property
+    def buffer(self) -> BufferView:
+        """View of the screen buffer, accessed like `buffer[y][x]`.
+
+        Each pixel is a `tuple` pair of visual character and optional color.
+        Pixels can be assigned through the view, like `buffer[y][x] = (char, color)`.
+
+        Returns:
+            BufferView: View of the screen buffer.
+        """
+        return BufferView(self._frame_buffer)
+
+    @buffer.setter
+    def buffer(self, rows: list[list[tuple[Char, ColorValue | None]]]) -> None:
+        """Set the content of the screen buffer.
+
+        Rows and pixels outside the screen buffer are ignored.
+
+        Args:
+            rows (list[list[tuple[Char, ColorValue | None]]]): Rows of pixels,
+                where each pixel is a `tuple` pair of character and optional color.
+        """
+        self._frame_buffer.reset()
+        self._frame_buffer.load_rows(rows)
 
     def reset_buffer(self) -> None:
         """Clear the screen `buffer`.
 
         It will fill the buffer with the transparency fill character,
         as well as `None` for the color, per "pixel".
+        The buffer is resized if `width`, `height` or `transparency_fill` has changed.
         """
-        self.buffer = [
-            # Pair structure: (char, color)
-            [(self.transparency_fill, None) for _ in range(self.width)]
-            for _ in range(self.height)
-        ]
+        if not self._resize_buffer_if_necessary():
+            self._frame_buffer.reset()
+
+    def _resize_buffer_if_necessary(self) -> bool:
+        """Resize the screen buffer if `width`, `height` or `transparency_fill` changed.
+
+        Returns:
+            bool: `True` if resized, which leaves every cell blank, `False` otherwise.
+        """
+        frame_buffer = self._frame_buffer
+        if (
+            frame_buffer.width != self.width
+            or frame_buffer.height != self.height
+            or frame_buffer.fill != self.transparency_fill
+        ):
+            frame_buffer.resize(self.width, self.height, self.transparency_fill)
+            return True
+        return False
 
     def render_all(self, nodes: Sequence[Renderable], /) -> None:
         """Render all nodes provided to the screen buffer.
 
+        Nodes are drawn in order of `z_index`. If `nodes` is a `RenderList`,
+        the nodes are already sorted, and are drawn in the given order.
+
+        Nodes are drawn once per viewport in `viewports`, each clipped to its
+        own rectangle. If there are no viewports, the whole screen is used as
+        viewport for `Camera.current`. Sorting, visibility and global transforms
+        are only computed once, and shared between viewports.
+
         Args:
             nodes (Sequence[Renderable]): Sequence of nodes with `TextureComponent`.
 
@@ -340,25 +528,12 @@ class Screen(metaclass=ScreenClassProperties):
             ValueError: If a any node has an invalid transparency character length,
                 which is not equal to `1`.
         """
-        nodes_sorted_by_z_index = sorted(nodes, key=lambda node: node.z_index)
-
-        # Include half size of camera parent when including size
-        viewport_global_position = Camera.current.global_position
-
-        if Camera.current.mode & Camera.MODE_INCLUDE_SIZE and isinstance(
-            Camera.current.parent, TextureComponent
-        ):
-            # Adds half of camera's parent's texture size
-            viewport_global_position += Camera.current.parent.get_texture_size() / 2
-
-        # Determine whether to use use the parent of current camera
-        # or its parent as anchor for viewport
-        anchor = Camera.current
-        if not Camera.current.top_level and isinstance(
-            Camera.current.parent, TransformComponent
-        ):
-            anchor = Camera.current.parent
+        if isinstance(nodes, RenderList):
+            nodes_sorted_by_z_index: Sequence[Renderable] = nodes
+        else:
+            nodes_sorted_by_z_index = sorted(nodes, key=lambda node: node.z_index)
 
+        visible_nodes: list[tuple[Renderable, Vec2, float]] = []
         for node in nodes_sorted_by_z_index:
             if not node.is_globally_visible():
                 continue
@@ -369,94 +544,492 @@ class Screen(metaclass=ScreenClassProperties):
                     f"{len(node.transparency)} != 1"
                 )
 
-            # Cache and lookup node properties/attributes
+            visible_nodes.append((node, node.global_position, node.global_rotation))
+
+        for viewport in self._get_viewports():
+            self._render_viewport(visible_nodes, viewport)
+
+    def _get_viewports(self) -> Sequence[Viewport]:
+        """Get viewports to render, defaulting to the whole screen.
+
+        Returns:
+            Sequence[Viewport]: `viewports`, or a single viewport covering
+                the whole screen, using `Camera.current`.
+        """
+        if self.viewports:
+            return self.viewports
+        return (Viewport(0, 0, self.width, self.height, Camera.current),)
+
+    def _render_viewport(
+        self,
+        visible_nodes: list[tuple[Renderable, Vec2, float]],
+        viewport: Viewport,
+    ) -> None:
+        """Render visible nodes from the camera of viewport, clipped to its rectangle.
+
+        Args:
+            visible_nodes (list[tuple[Renderable, Vec2, float]]): Nodes sorted by
+                z-index, with their global position and global rotation.
+            viewport (Viewport): Viewport to render into.
+        """
+        frame_buffer = self._frame_buffer
+        clip = (
+            max(0, viewport.x),
+            max(0, viewport.y),
+            min(frame_buffer.width, viewport.x + viewport.width),
+            min(frame_buffer.height, viewport.y + viewport.height),
+        )
+        if clip[0] >= clip[2] or clip[1] >= clip[3]:
+            return  # Entirely outside the screen
+        self._clip = clip
+
+        # Cache and lookup values that are the same for all nodes
+        anchor_global_position = self._get_camera_anchor(viewport.camera).global_position
+        anchor_x = anchor_global_position.x
+        anchor_y = anchor_global_position.y
+        # Offset from anchor to upper left corner of viewport on screen
+        offset_x = viewport.x
+        offset_y = viewport.y
+        if viewport.camera.mode & Camera.MODE_CENTERED:
+            offset_x += viewport.width / 2
+            offset_y += viewport.height / 2
+
+        for node, node_global_position, node_global_rotation in visible_nodes:
+            relative_x = node_global_position.x - anchor_x + offset_x
+            relative_y = node_global_position.y - anchor_y + offset_y
+
+            if isinstance(node, TileMap):
+                self._render_tile_map(node, relative_x, relative_y)
+            elif node_global_rotation:
+                self._render_rotated(node, relative_x, relative_y, node_global_rotation)
+            else:
+                # Fast path, since no rotation means the texture is axis-aligned
+                self._render_unrotated(node, relative_x, relative_y)
+
+    def _get_camera_anchor(self, camera: Camera) -> TransformComponent:
+        """Get node that the viewport of camera is positioned relative to.
+
+        Args:
+            camera (Camera): Camera of the viewport.
+
+        Returns:
+            TransformComponent: Camera, or its parent if not `top_level`.
+        """
+        # Determine whether to use use the parent of current camera
+        # or its parent as anchor for viewport
+        anchor: TransformComponent = camera
+        if not camera.top_level and isinstance(camera.parent, TransformComponent):
+            anchor = camera.parent
+        return anchor
+
+    def _load_static_layer(self, static_nodes: RenderList) -> None:
+        """Load layer of static nodes into screen buffer, in place of resetting it.
+
+        The layer is cached, and only rendered again if any static node
+        has changed its texture, transform, visibility or look,
+        or if any viewport, camera or the screen has changed.
+        The layer is only cached once nothing has changed for a frame,
+        so static nodes cost the same as other nodes while things keep changing,
+        like when the camera is moving.
+
+        Args:
+            static_nodes (RenderList): Nodes with `static` set, sorted by z-index.
+        """
+        layer_key: list[tuple[object, ...]] = [
+            (self.width, self.height, self.transparency_fill)
+        ]
+        for viewport in self._get_viewports():
+            anchor_global_position = self._get_camera_anchor(
+                viewport.camera
+            ).global_position
+            layer_key.append(
+                (
+                    *viewport,
+                    viewport.camera.mode,
+                    anchor_global_position.x,
+                    anchor_global_position.y,
+                )
+            )
+        for node in static_nodes:
             node_global_position = node.global_position
-            node_global_rotation = node.global_rotation
-            node_color: ColorValue | None = getattr(node, "color")  # noqa: B009
-
-            relative_position = node_global_position - anchor.global_position
-
-            if Camera.current.mode & Camera.MODE_CENTERED:
-                relative_position.x += self.width / 2
-                relative_position.y += self.height / 2
-
-            # Offset from centering
-            offset_x = 0
-            offset_y = 0
-            if node.centered:
-                node_texture_size = node.get_texture_size()
-                offset_x = node_texture_size.x / 2
-                offset_y = node_texture_size.y / 2
-
-            # TODO: Improve performance by using simpler solution when no rotation
-            #     - Iterate over each cell, for each row
-            for h, row in enumerate(node.texture):
-                for w, char in enumerate(row):
-                    if char == node.transparency:
-                        continue
-
-                    # Adjust starting point based on centering
-                    x_diff = w - offset_x
-                    y_diff = h - offset_y
-
-                    # Apply rotation using upper-left as the origin
-                    # NOTE: `-node_global_rotation` means counter clockwise
-                    # Cache using variable
-                    neg_node_global_rotation = -node_global_rotation
-                    rotated_x = (
-                        cos(neg_node_global_rotation) * x_diff
-                        - sin(neg_node_global_rotation) * y_diff
-                    )
-                    rotated_y = (
-                        sin(neg_node_global_rotation) * x_diff
-                        + cos(neg_node_global_rotation) * y_diff
-                    )
-
-                    # Translate to final screen position
-                    final_x = relative_position.x + rotated_x
-                    final_y = relative_position.y + rotated_y
-
-                    # Apply horizontal index snap
-                    char_index = floor(final_x)
-                    # Do horizontal boundary check
-                    if char_index < 0 or char_index >= self.width:
-                        continue
-
-                    # Apply vertical index snap
-                    row_index = floor(final_y)
-                    # Do vertical boundary check
-                    if row_index < 0 or row_index >= self.height:
-                        continue
-
-                    # Insert rotated char into screen buffer
-                    rotated_char = text.rotate(char, node_global_rotation)
-                    self.buffer[row_index][char_index] = (rotated_char, node_color)
+            layer_key.append(
+                (
+                    node.uid,
+                    node.is_globally_visible(),
+                    node_global_position.x,
+                    node_global_position.y,
+                    node.global_rotation,
+                    node.centered,
+                    node.transparency,
+                    getattr(node, "color", None),
+                    node._revision if isinstance(node, TileMap) else None,
+                )
+            )
+        # NOTE: Compared by content, since textures may be mutated in place
+        textures = [node.texture for node in static_nodes]
+        frame_buffer = self._frame_buffer
+        static_layer = self._static_layer
+        if (
+            static_layer is not None
+            and layer_key == self._static_layer_key
+            and textures == self._static_layer_textures
+        ):
+            self._resize_buffer_if_necessary()
+            frame_buffer.chars[:] = static_layer.chars
+            frame_buffer.colors[:] = static_layer.colors
+            return
+        self.reset_buffer()
+        self.render_all(static_nodes)
+        if (
+            layer_key == self._static_layer_key
+            and textures == self._static_layer_textures
+        ):
+            # Unchanged since the previous frame, so likely to stay unchanged
+            self._static_layer = frame_buffer.copy()
+            self._static_layer_textures = [texture.copy() for texture in textures]
+        else:
+            # NOTE: Not cached yet, since copying would only add to the cost
+            #       if the layer changes every frame
+            self._static_layer = None
+            self._static_layer_key = layer_key
+            self._static_layer_textures = textures
+
+    def _render_unrotated(
+        self,
+        node: Renderable,
+        relative_x: float,
+        relative_y: float,
+    ) -> None:
+        """Render node without rotation, skipping it if outside the viewport.
+
+        Args:
+            node (Renderable): Node to render.
+            relative_x (float): Horizontal position of node on screen.
+            relative_y (float): Vertical position of node on screen.
+        """
+        clip_left, clip_top, clip_right, clip_bottom = self._clip
+        texture = node.texture
+        # Offset from centering
+        offset_x = 0
+        offset_y = 0
+        if node.centered:
+            node_texture_size = node.get_texture_size()
+            offset_x = node_texture_size.x / 2
+            offset_y = node_texture_size.y / 2
+        origin_x = floor(relative_x - offset_x)
+        origin_y = floor(relative_y - offset_y)
+        # Skip nodes entirely outside the viewport,
+        # where the left edge needs the (more costly) texture width
+        if (
+            origin_x >= clip_right
+            or origin_y >= clip_bottom
+            or origin_y + len(texture) <= clip_top
+            or (
+                origin_x < clip_left
+                and origin_x + get_texture_size(texture).x <= clip_left
+            )
+        ):
+            return
+        self._blit_texture(
+            texture,
+            origin_x,
+            origin_y,
+            node.transparency,
+            self._frame_buffer.intern_color(getattr(node, "color")),  # noqa: B009
+        )
+
+    def _render_tile_map(
+        self,
+        tile_map: TileMap,
+        relative_x: float,
+        relative_y: float,
+    ) -> None:
+        """Render chunks of tile map that are inside the viewport.
+
+        Args:
+            tile_map (TileMap): Tile map to render.
+            relative_x (float): Horizontal position of tile map on screen.
+            relative_y (float): Vertical position of tile map on screen.
+        """
+        clip_left, clip_top, clip_right, clip_bottom = self._clip
+        origin_x = floor(relative_x)
+        origin_y = floor(relative_y)
+        chunk_width = tile_map.chunk_size * tile_map.tile_size.x
+        chunk_height = tile_map.chunk_size * tile_map.tile_size.y
+        if not chunk_width or not chunk_height:
+            return
+        color_id = self._frame_buffer.intern_color(getattr(tile_map, "color"))  # noqa: B009
+        # Only visit chunks overlapping the viewport, regardless of map size
+        for chunk_y in range(
+            (clip_top - origin_y) // chunk_height,
+            (clip_bottom - 1 - origin_y) // chunk_height + 1,
+        ):
+            for chunk_x in range(
+                (clip_left - origin_x) // chunk_width,
+                (clip_right - 1 - origin_x) // chunk_width + 1,
+            ):
+                rows = tile_map.get_chunk_rows((chunk_x, chunk_y))
+                if rows is None:
+                    continue
+                self._blit_texture(
+                    rows,
+                    origin_x + chunk_x * chunk_width,
+                    origin_y + chunk_y * chunk_height,
+                    tile_map.transparency,
+                    color_id,
+                )
+
+    def _render_rotated(
+        self,
+        node: Renderable,
+        relative_x: float,
+        relative_y: float,
+        rotation: float,
+    ) -> None:
+        """Render node with rotation, skipping it if outside the viewport.
+
+        Args:
+            node (Renderable): Node to render.
+            relative_x (float): Horizontal position of node on screen.
+            relative_y (float): Vertical position of node on screen.
+            rotation (float): Global rotation of node in radians.
+        """
+        # Rotated cells are cached, as long as texture and angle stays the same
+        rotated = self._get_rotated_cells(
+            node.texture,
+            rotation,
+            node.centered,
+            node.transparency,
+        )
+        if not rotated.cells:
+            return
+        # Cache and lookup values used in the inner loop
+        frame_buffer = self._frame_buffer
+        width = frame_buffer.width
+        chars = frame_buffer.chars
+        colors = frame_buffer.colors
+        clip_left, clip_top, clip_right, clip_bottom = self._clip
+        # Bounding box of the node in screen space,
+        # where snapping is done per edge, as `floor` preserves order
+        left = floor(relative_x + rotated.min_x)
+        right = floor(relative_x + rotated.max_x)
+        top = floor(relative_y + rotated.min_y)
+        bottom = floor(relative_y + rotated.max_y)
+        if (
+            right < clip_left
+            or left >= clip_right
+            or bottom < clip_top
+            or top >= clip_bottom
+        ):
+            return  # Entirely outside the viewport
+
+        color_id = frame_buffer.intern_color(getattr(node, "color"))  # noqa: B009
+        if (
+            left >= clip_left
+            and right < clip_right
+            and top >= clip_top
+            and bottom < clip_bottom
+        ):
+            # Entirely inside the viewport, so boundary checks can be skipped
+            for x_diff, y_diff, rotated_char in rotated.cells:
+                index = (
+                    floor(relative_y + y_diff) * width  # Row
+                    + floor(relative_x + x_diff)  # Column
+                )
+                chars[index] = rotated_char
+                colors[index] = color_id
+            return
+        for x_diff, y_diff, rotated_char in rotated.cells:
+            # Apply horizontal index snap, then do horizontal boundary check
+            char_index = floor(relative_x + x_diff)
+            if char_index < clip_left or char_index >= clip_right:
+                continue
+            # Apply vertical index snap, then do vertical boundary check
+            row_index = floor(relative_y + y_diff)
+            if row_index < clip_top or row_index >= clip_bottom:
+                continue
+            # Insert rotated char into screen buffer
+            index = row_index * width + char_index
+            chars[index] = rotated_char
+            colors[index] = color_id
+
+    def _get_rotated_cells(
+        self,
+        texture: list[str],
+        rotation: float,
+        centered: bool,
+        transparency: Char | None,
+    ) -> RotatedCells:
+        """Get offsets and rotated characters for each opaque cell of a texture.
+
+        The rotation is quantized into `_ROTATION_STEPS` steps per turn,
+        and the result is cached per texture, angle, centering and transparency.
+        A cached entry is only reused if the texture content is still equal,
+        so mutating a texture in place is safe.
+
+        Args:
+            texture (list[str]): Texture to rotate.
+            rotation (float): Counter clockwise rotation in radians.
+            centered (bool): Whether the texture is rotated around its center,
+                instead of its upper left corner.
+            transparency (Char | None): Character to skip, if any.
+
+        Returns:
+            RotatedCells: Offsets and rotated character per cell, with bounds.
+        """
+        step = round(rotation % TAU / _ROTATION_STEP_SIZE) % _ROTATION_STEPS
+        key = (id(texture), step, centered, transparency)
+        cached = self._rotation_cache.get(key)
+        if cached is not None and cached[0] == texture:
+            return cached[1]
+        rotated = _compute_rotated_cells(
+            texture,
+            step * _ROTATION_STEP_SIZE,
+            centered,
+            transparency,
+        )
+        if len(self._rotation_cache) >= _ROTATION_CACHE_SIZE:
+            # Evict oldest entry, as `dict` preserves insertion order
+            del self._rotation_cache[next(iter(self._rotation_cache))]
+        # Store a copy of the texture, to detect later changes made in place
+        self._rotation_cache[key] = (texture.copy(), rotated)
+        return rotated
+
+    def _blit_texture(
+        self,
+        texture: list[str],
+        origin_x: int,
+        origin_y: int,
+        transparency: Char | None,
+        color_id: int,
+    ) -> None:
+        """Copy an unrotated texture into the screen buffer.
+
+        The texture is clipped to the current viewport, and each line is copied
+        as whole slices of opaque characters.
+
+        Args:
+            texture (list[str]): Texture to copy.
+            origin_x (int): Column of the upper left corner of the texture.
+            origin_y (int): Row of the upper left corner of the texture.
+            transparency (Char | None): Character to skip, if any.
+            color_id (int): Interned color of the copied characters.
+        """
+        frame_buffer = self._frame_buffer
+        width = frame_buffer.width
+        chars = frame_buffer.chars
+        colors = frame_buffer.colors
+        clip_left, clip_top, clip_right, clip_bottom = self._clip
+        color_run = array(COLOR_ID_TYPECODE, [color_id])
+        first_h = max(0, clip_top - origin_y)
+        last_h = min(len(texture), clip_bottom - origin_y)
+        first_w = max(0, clip_left - origin_x)
+        for h in range(first_h, last_h):
+            line = texture[h]
+            last_w = min(len(line), clip_right - origin_x)
+            if first_w >= last_w:
+                continue
+            row_offset = (origin_y + h) * width + origin_x
+            if transparency is None or transparency not in line:
+                chars[row_offset + first_w : row_offset + last_w] = line[first_w:last_w]
+                colors[row_offset + first_w : row_offset + last_w] = color_run * (
+                    last_w - first_w
+                )
+                continue
+            for span in _opaque_spans_pattern(transparency).finditer(
+                line,
+                first_w,
+                last_w,
+            ):
+                start, end = span.span()
+                chars[row_offset + start : row_offset + end] = span.group()
+                colors[row_offset + start : row_offset + end] = color_run * (end - start)
 
     def show(self) -> None:
         """Show content of screen buffer.
 
         This will print the formatted frame to the terminal,
         if `stream` is set to `sys.stdout`.
+
+        When `diff_output` is enabled, only the cells that changed since
+        the previous frame are written. A full redraw is done instead
+        on the first frame, or when the frame dimensions have changed.
+
+        When `threaded_output` is enabled, the frame is handed over to
+        the writer thread instead. A full redraw is also done if the previous
+        frame is still pending, since it will be replaced without being written.
+
+        If `recorder` is set, the frame is also passed to it.
         """
+        if self.recorder is not None:
+            self.recorder.record(self)
         actual_size = self.get_actual_size()
-        # Construct frame from screen buffer
-        out = ""
         is_using_ansi = self.is_using_ansi()
-        for lino, row in enumerate(self.buffer[: actual_size.y], start=1):
-            for char, color in row[: actual_size.x]:
-                if is_using_ansi:
-                    if color is None:
-                        out += RESET + char
-                    else:
-                        out += RESET + color + char
-                else:
-                    out += char
-            if lino != actual_size.y:  # Not at end
-                out += "\n"
-        if is_using_ansi:
-            out += RESET
-            cursor_move_code = f"\x1b[{actual_size.y - 1}A" + "\r"
-            out += cursor_move_code
+        frame_buffer = self._frame_buffer
+        # Visible part of screen buffer
+        visible_width = max(0, min(actual_size.x, frame_buffer.width))
+        visible_height = max(0, min(actual_size.y, frame_buffer.height))
+        previous_frame = self._previous_frame
+        frame_writer = self._frame_writer
+        if (
+            is_using_ansi
+            and self.diff_output
+            and previous_frame is not None
+            and (frame_writer is None or not frame_writer.has_pending)
+            and previous_frame.width == frame_buffer.width
+            and previous_frame.height == frame_buffer.height
+            and self._previous_size == (visible_width, visible_height)
+        ):
+            out = _build_frame_diff(
+                frame_buffer,
+                previous_frame,
+                visible_width,
+                visible_height,
+            )
+        else:
+            out = _build_frame(
+                frame_buffer,
+                visible_width,
+                visible_height,
+                is_using_ansi,
+            )
+        if self.diff_output and is_using_ansi:
+            self._previous_frame = frame_buffer.copy()
+            self._previous_size = (visible_width, visible_height)
+        else:
+            self._previous_frame = None
+        if frame_writer is not None:
+            if out:
+                frame_writer.submit(out)
+            return
+        self._write(out)
+
+    def _write(self, out: str) -> None:
+        """Write formatted frame to `stream`, and flush it.
+
+        When `byte_output` is enabled, the frame is encoded into bytes,
+        and written to the file descriptor of `stream` using `os.write`.
+        Otherwise, or if `stream` has no file descriptor,
+        the frame is written to `stream` as text.
+
+        Args:
+            out (str): Formatted frame.
+        """
+        if self.byte_output and out:
+            try:
+                fileno = self.stream.fileno()
+            except (ValueError, OSError):
+                pass  # Like `io.StringIO.fileno()`, so fall back to writing text
+            else:
+                # Flush pending text first, to keep output in order
+                self.stream.flush()
+                encoding = getattr(self.stream, "encoding", None) or "utf-8"
+                errors = getattr(self.stream, "errors", None) or "strict"
+                # NOTE: Written through a view of the encoded bytes,
+                #       so partial writes continue without copying the rest
+                with memoryview(out.encode(encoding, errors)) as data:
+                    _write_all(fileno, data)
+                return
         # Write and flush
         self.stream.write(out)
         self.stream.flush()
@@ -465,17 +1038,283 @@ class Screen(metaclass=ScreenClassProperties):
         """Refresh the screen, by performing multiple steps.
 
         The steps are:
-        1. Resize screen if necessary.
-        2. Reset screen buffer.
-        3. Render all texture nodes in current scene.
+        1. Resize screen if necessary, and free colors if too many are interned.
+        2. Reset screen buffer, or load the cached layer of static nodes.
+        3. Render all other texture nodes in current scene.
         4. Show rendered content in terminal.
+
+        The time spent is stored in `refresh_time`.
         """
+        start_time = perf_counter()
         self._resize_if_necessary()
-        self.reset_buffer()
-        # NOTE: Uses underlying `list` because it's faster than `tuple` when copying
-        texture_nodes = Scene.current.get_group_members(
-            Group.TEXTURE,
-            type_hint=TextureNode,
-        )
+        # NOTE: Colors are interned as ids that are never freed, so with many colors,
+        #       like from fading effects, start over before rendering this frame,
+        #       and drop cached frames using the old ids
+        if len(self._frame_buffer.palette) > self.max_palette_size:
+            self._frame_buffer.reset_palette()
+            self._previous_frame = None  # Diff against old ids is invalid, so redraw
+            self._static_layer = None
+        # NOTE: Render order is kept sorted by z-index,
+        #       and is only rebuilt when texture nodes are added, freed or moved
+        render_order = get_render_order(Scene.current)
+        # Static nodes are loaded from a cached layer, below all other nodes
+        static_nodes = render_order.get_static_render_list()
+        if static_nodes:
+            self._load_static_layer(static_nodes)
+        else:
+            self._static_layer = None
+            self.reset_buffer()
+        texture_nodes = render_order.get_dynamic_render_list()
         self.render_all(texture_nodes)
         self.show()
+        self.refresh_time = perf_counter() - start_time
+
+
+def _write_all(fileno: int, data: memoryview) -> None:
+    """Write all of `data` to file descriptor, continuing after partial writes.
+
+    Args:
+        fileno (int): File descriptor to write to.
+        data (memoryview): Bytes to write.
+    """
+    written = 0
+    size = len(data)
+    while written < size:
+        try:
+            written += os.write(fileno, data[written:])
+        except BlockingIOError:
+            # Non-blocking file descriptor is full, so wait until it is writable
+            select.select([], [fileno], [])
+
+
+def _build_frame(
+    frame_buffer: FrameBuffer,
+    visible_width: int,
+    visible_height: int,
+    is_using_ansi: bool,
+    *,
+    newline: str = "\n",
+) -> str:
+    """Build output for a full redraw of the visible part of the frame.
+
+    Args:
+        frame_buffer (FrameBuffer): Frame to draw.
+        visible_width (int): Number of columns to draw, from the left.
+        visible_height (int): Number of rows to draw, from the top.
+        is_using_ansi (bool): Whether to include ANSI codes.
+        newline (str, optional): Separator between rows. Defaults to a line feed,
+            which a terminal turns into a carriage return and a line feed.
+
+    Returns:
+        str: Formatted frame.
+    """
+    chars = frame_buffer.chars
+    row_starts = range(0, visible_height * frame_buffer.width, frame_buffer.width)
+    if not is_using_ansi:
+        return newline.join(
+            "".join(chars[row_start : row_start + visible_width])
+            for row_start in row_starts
+        )
+    # Parts are joined once at the end, instead of growing a string per part
+    parts = [RESET]
+    # Color state is carried across rows, since newlines do not reset it
+    current_color_id = NO_COLOR_ID
+    for lino, row_start in enumerate(row_starts, start=1):
+        current_color_id = _encode_cells(
+            parts,
+            frame_buffer,
+            row_start,
+            row_start + visible_width,
+            current_color_id,
+        )
+        if lino != visible_height:  # Not at end
+            parts.append(newline)
+    parts.append(RESET)
+    cursor_move_code = f"\x1b[{visible_height - 1}A" + "\r"
+    parts.append(cursor_move_code)
+    return "".join(parts)
+
+
+def _build_frame_diff(
+    frame_buffer: FrameBuffer,
+    previous_frame: FrameBuffer,
+    visible_width: int,
+    visible_height: int,
+) -> str:
+    """Build output that only updates the cells changed since `previous_frame`.
+
+    Expects the cursor to be at the upper left corner of the frame,
+    which is also where the cursor is moved back to afterwards.
+
+    Args:
+        frame_buffer (FrameBuffer): Frame to draw.
+        previous_frame (FrameBuffer): Frame shown in the terminal,
+            with the same dimensions and palette as `frame_buffer`.
+        visible_width (int): Number of columns to draw, from the left.
+        visible_height (int): Number of rows to draw, from the top.
+
+    Returns:
+        str: Formatted changes, or an empty string if nothing changed.
+    """
+    chars = frame_buffer.chars
+    colors = frame_buffer.colors
+    previous_chars = previous_frame.chars
+    previous_colors = previous_frame.colors
+    parts = [RESET]
+    cursor_row = 0
+    # Color state is carried across runs, since cursor movement does not reset it
+    current_color_id = NO_COLOR_ID
+    for row_index in range(visible_height):
+        row_start = row_index * frame_buffer.width
+        row_end = row_start + visible_width
+        # Fast path for rows without changes
+        if (
+            colors[row_start:row_end] == previous_colors[row_start:row_end]
+            and chars[row_start:row_end] == previous_chars[row_start:row_end]
+        ):
+            continue
+        for start, end in _find_changed_runs(
+            frame_buffer,
+            previous_frame,
+            row_start,
+            row_end,
+        ):
+            if row_index != cursor_row:
+                parts.append(f"\x1b[{row_index - cursor_row}B")
+                cursor_row = row_index
+            parts.append("\r")
+            if start != row_start:
+                parts.append(f"\x1b[{start - row_start}C")
+            current_color_id = _encode_cells(
+                parts,
+                frame_buffer,
+                start,
+                end,
+                current_color_id,
+            )
+    if len(parts) == 1:  # Only the leading reset
+        return ""
+    parts.append(RESET)
+    if cursor_row:
+        parts.append(f"\x1b[{cursor_row}A")
+    parts.append("\r")
+    return "".join(parts)
+
+
+def _encode_cells(
+    parts: list[str],
+    frame_buffer: FrameBuffer,
+    start: int,
+    end: int,
+    current_color_id: int,
+) -> int:
+    """Encode cells with ANSI colors, only emitting codes where the color changes.
+
+    Args:
+        parts (list[str]): Output parts, which encoded cells are appended to.
+        frame_buffer (FrameBuffer): Frame with cells to encode.
+        start (int): Flat index of first cell (inclusive).
+        end (int): Flat index of last cell (exclusive).
+        current_color_id (int): Color active in the terminal before the first cell,
+            where `NO_COLOR_ID` means the reset state.
+
+    Returns:
+        int: Color id active after the encoded cells.
+    """
+    chars = frame_buffer.chars
+    palette = frame_buffer.palette
+    start_codes = palette.start_codes
+    switch_codes = palette.switch_codes
+    run_start = start
+    for color_id, run in groupby(frame_buffer.colors[start:end]):
+        run_end = run_start + len(list(run))
+        if color_id != current_color_id:
+            if current_color_id == NO_COLOR_ID:
+                parts.append(start_codes[color_id])
+            else:
+                parts.append(switch_codes[color_id])
+            current_color_id = color_id
+        parts.append("".join(chars[run_start:run_end]))
+        run_start = run_end
+    return current_color_id
+
+
+def _compute_rotated_cells(
+    texture: list[str],
+    rotation: float,
+    centered: bool,
+    transparency: Char | None,
+) -> RotatedCells:
+    """Compute offsets and rotated characters for each opaque cell of a texture."""
+    # Offset from centering
+    offset_x = 0
+    offset_y = 0
+    if centered:
+        texture_size = get_texture_size(texture)
+        offset_x = texture_size.x / 2
+        offset_y = texture_size.y / 2
+    # Apply rotation using upper-left as the origin
+    # NOTE: `-rotation` means counter clockwise
+    cos_rotation = cos(-rotation)
+    sin_rotation = sin(-rotation)
+    cells: list[tuple[float, float, Char]] = []
+    # NOTE: Symbols are rotated a whole row at a time, using precomputed tables
+    for h, (row, rotated_row) in enumerate(
+        zip(texture, text.rotate_lines(texture, rotation), strict=True)
+    ):
+        # Adjust starting point based on centering
+        y_diff = h - offset_y
+        for w, (char, rotated_char) in enumerate(zip(row, rotated_row, strict=True)):
+            if char == transparency:
+                continue
+            x_diff = w - offset_x
+            cells.append(
+                (
+                    cos_rotation * x_diff - sin_rotation * y_diff,
+                    sin_rotation * x_diff + cos_rotation * y_diff,
+                    rotated_char,
+                )
+            )
+    if not cells:  # Nothing to draw, so bounds are never used
+        return RotatedCells(cells, 0, 0, 0, 0)
+    return RotatedCells(
+        cells,
+        min(cell[0] for cell in cells),
+        min(cell[1] for cell in cells),
+        max(cell[0] for cell in cells),
+        max(cell[1] for cell in cells),
+    )
+
+
+@lru_cache
+def _opaque_spans_pattern(transparency: Char) -> re.Pattern[str]:
+    """Get pattern matching spans of characters that are not `transparency`."""
+    return re.compile(f"[^{re.escape(transparency)}]+")
+
+
+def _find_changed_runs(
+    frame_buffer: FrameBuffer,
+    previous_frame: FrameBuffer,
+    start: int,
+    end: int,
+) -> list[tuple[int, int]]:
+    """Find spans of changed cells, as pairs of start (inclusive) and end (exclusive).
+
+    Spans separated by fewer than `_DIFF_MERGE_GAP` unchanged cells are merged.
+    """
+    runs: list[tuple[int, int]] = []
+    for index, char, previous_char, color_id, previous_color_id in zip(
+        range(start, end),
+        frame_buffer.chars[start:end],
+        previous_frame.chars[start:end],
+        frame_buffer.colors[start:end],
+        previous_frame.colors[start:end],
+        strict=True,
+    ):
+        if char == previous_char and color_id == previous_color_id:
+            continue
+        if runs and index - runs[-1][1] < _DIFF_MERGE_GAP:
+            runs[-1] = (runs[-1][0], index + 1)
+        else:
+            runs.append((index, index + 1))
+    return runs
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from time import perf_counter_ns
+from typing import Callable, NamedTuple
+
+from charz_core import Scene
+
+from ._engine import Engine, refresh_screen, tick_clock
+from ._time import Time
+
+
+class SimulationStats(NamedTuple):
+    """Timing stats of a batch of frames, made by `simulate`.
+
+    All times are in seconds.
+
+    Attributes:
+        `frame_count`: `int` - Number of frames run.
+        `elapsed`: `float` - Real time spent running frames.
+        `simulated`: `float` - Time simulated, from the synthetic delta time.
+        `mean_frame_time`: `float` - Mean real time per frame.
+        `max_frame_time`: `float` - Longest real time of a frame.
+        `fps`: `property[float]` - Frames run per real second.
+        `speedup`: `property[float]` - Simulated time per real second.
+    """
+
+    frame_count: int
+    elapsed: float
+    simulated: float
+    mean_frame_time: float
+    max_frame_time: float
+
+    @property
+    def fps(self) -> float:
+        """Frames run per real second."""
+        return self.frame_count / self.elapsed if self.elapsed else 0
+
+    @property
+    def speedup(self) -> float:
+        """Simulated time per real second."""
+        return self.simulated / self.elapsed if self.elapsed else 0
+
+
+def simulate(
+    target: Engine | Scene,
+    /,
+    frame_count: int,
+    *,
+    delta: float = 1 / 60,
+    render: bool = False,
+) -> SimulationStats:
+    """Run frames of an engine or scene as fast as possible.
+
+    `Time.delta` is set to `delta` for every frame, instead of being measured,
+    so the result is the same no matter how fast the frames run.
+    For an `Engine`, every frame task except `tick_clock` is run,
+    so the clock never sleeps. If `render` is set, the screen is refreshed
+    every frame in place of `refresh_screen`, without frame skipping.
+    The screen is not set up, so use `HeadlessScreen` when rendering.
+    Stops early if `Engine.is_running` is set to `False`,
+    and `Engine.is_running` is restored afterwards.
+    For a `Scene`, the scene is made the current scene, then processed each frame.
+
+    `NOTE` Fixed steps from `Engine.fixed_fps` are not used,
+    since each frame already has a fixed delta time.
+
+    Example:
+
+    ```python
+    from charz import simulate
+
+    stats = simulate(MyGame(), 10_000, delta=1 / 60)
+    print(f"Simulated {stats.simulated:.0f}s at {stats.speedup:.0f}x real time")
+    ```
+
+    Args:
+        target (Engine | Scene): Engine or scene to run frames of.
+        frame_count (int): Number of frames to run.
+        delta (float, optional): Delta time of each frame. Defaults to `1 / 60`.
+        render (bool, optional): Whether to refresh the screen of an engine.
+            Defaults to `False`.
+
+    Returns:
+        SimulationStats: Timing stats of the frames run.
+
+    Raises:
+        ValueError: If `frame_count` or `delta` is negative.
+    """
+    if frame_count < 0:
+        raise ValueError(
+            f"Parameter 'frame_count' must be non-negative, got {frame_count}"
+        )
+    if delta < 0:
+        raise ValueError(f"Parameter 'delta' must be non-negative, got {delta}")
+    engine: Engine | None = None
+    was_running = False
+    if isinstance(target, Scene):
+        if Scene.current is not target:
+            target.set_current()
+        run_frame = target.process
+    else:
+        engine = target
+        was_running = engine.is_running
+        engine.is_running = True
+        run_frame = _get_engine_frame_runner(engine, render)
+    frame_times: list[int] = []
+    try:
+        for _ in range(frame_count):
+            if engine is not None and not engine.is_running:
+                break
+            Time.delta = delta
+            Time.alpha = 0
+            start = perf_counter_ns()
+            run_frame()
+            frame_times.append(perf_counter_ns() - start)
+    finally:
+        if engine is not None:
+            engine.is_running = was_running
+    elapsed = sum(frame_times) / 1e9
+    return SimulationStats(
+        frame_count=len(frame_times),
+        elapsed=elapsed,
+        simulated=len(frame_times) * delta,
+        mean_frame_time=elapsed / len(frame_times) if frame_times else 0,
+        max_frame_time=max(frame_times, default=0) / 1e9,
+    )
+
+
+def _get_engine_frame_runner(engine: Engine, render: bool) -> Callable[[], None]:
+    def run_frame() -> None:
+        # NOTE: Tasks are looked up every frame, as tasks may be added at any time
+        for frame_task in list(engine.frame_tasks.values()):
+            # Compare with the original task, in case it is wrapped by `Profiler`
+            original_task = getattr(frame_task, "__wrapped__", frame_task)
+            if original_task is refresh_screen:
+                # NOTE: Refreshed directly, since frame skipping in `refresh_screen`
+                #       depends on the clock, which is never ticked
+                if render:
+                    engine.screen.refresh()
+            elif original_task is not tick_clock:
+                frame_task(engine)
+
+    return run_frame
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import signal
+from types import FrameType
+from typing import NoReturn, Any, final
+
+
+@final
+class ResizeSignal:
+    """`ResizeSignal` is a class namespace counting terminal resizes from `SIGWINCH`.
+
+    `Screen` compares `count` with the count it last saw,
+    to know when its cached terminal size has to be updated,
+    instead of asking the terminal for its size every frame.
+
+    `NOTE` Only available on platforms with `SIGWINCH`,
+    and only installable from the main thread.
+    `is_installed` stays `False` otherwise,
+    in which case `Screen` polls the terminal size at a low rate.
+
+    Attributes:
+        `count`: `ClassVar[int]` - Number of resizes since installed.
+        `is_installed`: `ClassVar[bool]` - Whether the signal handler is installed.
+    """
+
+    count: int = 0
+    is_installed: bool = False
+
+    def __new__(cls, *_args: Any, **_kwargs: Any) -> NoReturn:
+        raise RuntimeError(f"{cls.__name__} cannot be instantiated")
+
+    @classmethod
+    def install(cls) -> bool:
+        """Install `SIGWINCH` handler, if not already installed.
+
+        Any previously installed handler is still called, after `count` is updated.
+
+        Returns:
+            bool: `True` if installed, `False` if not supported.
+        """
+        if cls.is_installed:
+            return True
+        if not hasattr(signal, "SIGWINCH"):
+            return False
+        previous_handler = signal.getsignal(signal.SIGWINCH)
+
+        def handle_resize(signum: int, frame: FrameType | None) -> None:
+            cls.count += 1
+            if callable(previous_handler):
+                previous_handler(signum, frame)
+
+        try:
+            signal.signal(signal.SIGWINCH, handle_resize)
+        except ValueError:  # Not called from the main thread
+            return False
+        cls.is_installed = True
+        return True
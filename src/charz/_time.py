@@ -10,6 +10,10 @@ class Time:
     """`Time` is a class namespace used to store delta time.
 
     `Time.delta` is computed by `Clock`, handled by `Engine` frame task.
+    When `Engine.fixed_fps` is used, `Time.delta` is the fixed step duration
+    in logic, and `Time.alpha` is how far real time is into the next fixed step,
+    in range `[0, 1)`, for interpolating between the previous and current state
+    when rendering.
 
     Example:
 
@@ -37,6 +41,7 @@ class Time:
     """
 
     delta = NonNegative[float](0)
+    alpha = NonNegative[float](0)
 
     def __new__(cls, *_args: Any, **_kwargs: Any) -> NoReturn:
         raise RuntimeError(f"{cls.__name__} cannot be instantiated")
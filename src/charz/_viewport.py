@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from charz_core import Camera
+
+
+class Viewport(NamedTuple):
+    """Rectangle of `Screen` that is rendered from the view of a camera.
+
+    Used for split-screen and minimaps, by assigning multiple viewports
+    to `Screen.viewports`. Nodes outside the rectangle are clipped,
+    and `Camera.MODE_CENTERED` centers the camera in the rectangle.
+
+    Example:
+
+    ```python
+    from charz import Engine, Screen, Camera, Viewport
+
+    class SplitScreenGame(Engine):
+        screen = Screen(width=80, height=24)
+
+        def __init__(self) -> None:
+            self.left_camera = Camera(mode=Camera.MODE_CENTERED)
+            self.right_camera = Camera(mode=Camera.MODE_CENTERED)
+            self.screen.viewports = [
+                Viewport(0, 0, 40, 24, self.left_camera),
+                Viewport(40, 0, 40, 24, self.right_camera),
+            ]
+    ```
+
+    Attributes:
+        `x`: `int` - Column of upper left corner on screen.
+        `y`: `int` - Row of upper left corner on screen.
+        `width`: `int` - Width in characters.
+        `height`: `int` - Height in characters.
+        `camera`: `Camera` - Camera to render from.
+    """
+
+    x: int
+    y: int
+    width: int
+    height: int
+    camera: Camera
@@ -13,12 +13,16 @@ Includes
 - `fill_lines`
 - `flip_lines_h`
 - `flip_lines_v`
+- `flip_frames_h`
+- `flip_frames_v`
 - `rotate`
+- `rotate_line`
+- `rotate_lines`
 """
 
 from __future__ import annotations as _annotations
 
-from math import tau as _TAU
+from math import lcm as _lcm, tau as _TAU
 
 from ._annotations import Char
 
@@ -79,6 +83,9 @@ _vertical_conversions.update({
 #     # None for now...
 # })
 # fmt: on
+# Translation tables for flipping whole lines with `str.translate`
+_horizontal_translation: dict[int, str] = str.maketrans(_horizontal_conversions)
+_vertical_translation: dict[int, str] = str.maketrans(_vertical_conversions)
 # Predefined rotational conversions
 _rotational_conversions: dict[str, tuple[str, ...]] = {
     "-": ("-", "/", "|", "\\", "-", "/", "|", "\\"),
@@ -109,6 +116,32 @@ for _options in list(_rotational_conversions.values()):
 #     # None for now...
 # })
 # fmt: on
+# Number of equally sized sectors rotation angles are quantized to.
+# Chosen so that the sector boundaries of every char in `_rotational_conversions`,
+# which are offset by half a sector, line up with these sector boundaries
+_ROTATION_SECTOR_COUNT: int = 2 * _lcm(*map(len, _rotational_conversions.values()))
+_ROTATION_SECTOR_RADS: float = _TAU / _ROTATION_SECTOR_COUNT
+# Precomputed rotated variant of each char, indexed by quantized sector
+# fmt: off
+_rotation_tables: dict[str, tuple[str, ...]] = {
+    _char: tuple(
+        _options[
+            ((2 * _sector + 1) * len(_options) + _ROTATION_SECTOR_COUNT)
+            // (2 * _ROTATION_SECTOR_COUNT)
+            % len(_options)
+        ]
+        for _sector in range(_ROTATION_SECTOR_COUNT)
+    )
+    for _char, _options in _rotational_conversions.items()
+}
+# fmt: on
+# Translation table per quantized sector, for rotating whole lines with `str.translate`
+_rotation_translations: tuple[dict[int, str], ...] = tuple(
+    str.maketrans(
+        {_char: _variants[_sector] for _char, _variants in _rotation_tables.items()}
+    )
+    for _sector in range(_ROTATION_SECTOR_COUNT)
+)
 
 
 def fill(line: str, *, width: int, fill_char: Char = " ") -> str:
@@ -136,7 +169,7 @@ def flip_h(line: str, /) -> str:
     Returns:
         list[str]: Flipped line or character.
     """
-    return "".join(_horizontal_conversions.get(char, char) for char in reversed(line))
+    return line[::-1].translate(_horizontal_translation)
 
 
 def flip_v(line: str, /) -> str:
@@ -150,7 +183,7 @@ def flip_v(line: str, /) -> str:
     Returns:
         list[str]: Flipped line or character.
     """
-    return "".join(_vertical_conversions.get(char, char) for char in line)
+    return line.translate(_vertical_translation)
 
 
 def fill_lines(lines: list[str], *, fill_char: Char = " ") -> list[str]:
@@ -183,7 +216,13 @@ def flip_lines_h(lines: list[str], /) -> list[str]:
     Returns:
         list[str]: Flipped content
     """
-    return [flip_h(line) for line in lines]
+    # NOTE: Flipping all lines joined as one string, then restoring the order of lines,
+    #       is faster than flipping line by line
+    flipped = "\n".join(lines)[::-1].translate(_horizontal_translation).split("\n")
+    if len(flipped) != len(lines):  # No lines, or lines containing newlines
+        return [flip_h(line) for line in lines]
+    flipped.reverse()
+    return flipped
 
 
 def flip_lines_v(lines: list[str], /) -> list[str]:
@@ -197,7 +236,38 @@ def flip_lines_v(lines: list[str], /) -> list[str]:
     Returns:
         list[str]: Flipped content.
     """
-    return [flip_v(line) for line in reversed(lines)]
+    flipped = "\n".join(reversed(lines)).translate(_vertical_translation).split("\n")
+    if len(flipped) != len(lines):  # No lines, or lines containing newlines
+        return [flip_v(line) for line in reversed(lines)]
+    return flipped
+
+
+def flip_frames_h(frames: list[list[str]], /) -> list[list[str]]:
+    """Flip every frame horizontally.
+
+    Usefull for flipping animations.
+
+    Args:
+        frames (list[list[str]]): Frames of animation, where each frame is a texture.
+
+    Returns:
+        list[list[str]]: Flipped frames, in the same order.
+    """
+    return [flip_lines_h(frame) for frame in frames]
+
+
+def flip_frames_v(frames: list[list[str]], /) -> list[list[str]]:
+    """Flip every frame vertically.
+
+    Usefull for flipping animations.
+
+    Args:
+        frames (list[list[str]]): Frames of animation, where each frame is a texture.
+
+    Returns:
+        list[list[str]]: Flipped frames, in the same order.
+    """
+    return [flip_lines_v(frame) for frame in frames]
 
 
 def rotate(char: Char, /, angle: float) -> str:
@@ -210,11 +280,45 @@ def rotate(char: Char, /, angle: float) -> str:
     Returns:
         str: Rotated character or original character.
     """
-    if char in _rotational_conversions:
-        sector_count = len(_rotational_conversions[char])
-        sector_rads = _TAU / sector_count
-        half_sector_rads = sector_rads / 2
-        total_rads = (angle + half_sector_rads) % _TAU
-        index = int(total_rads / sector_rads) % sector_count
-        return _rotational_conversions[char][index]
-    return char
+    variants = _rotation_tables.get(char)
+    if variants is None:
+        return char
+    return variants[_get_rotation_sector(angle)]
+
+
+def rotate_line(line: str, /, angle: float) -> str:
+    """Rotate every character of a single line by angle counter clockwise.
+
+    Only the symbols are rotated, the order of the characters is kept.
+    The angle is quantized once for the whole line.
+
+    Args:
+        line (str): Line of characters to rotate.
+        angle (float): Counter clockwise rotation in radians.
+
+    Returns:
+        str: Line of rotated characters.
+    """
+    return line.translate(_rotation_translations[_get_rotation_sector(angle)])
+
+
+def rotate_lines(lines: list[str], /, angle: float) -> list[str]:
+    """Rotate every character of lines by angle counter clockwise.
+
+    Usefull for rotating the symbols of textures.
+    Only the symbols are rotated, the placement of the characters is kept.
+
+    Args:
+        lines (list[str]): Lines of strings or texture.
+        angle (float): Counter clockwise rotation in radians.
+
+    Returns:
+        list[str]: Lines of rotated characters.
+    """
+    translation = _rotation_translations[_get_rotation_sector(angle)]
+    return [line.translate(translation) for line in lines]
+
+
+def _get_rotation_sector(angle: float) -> int:
+    # NOTE: Extra modulo, since `angle % _TAU` may round up to `_TAU`
+    return int(angle % _TAU / _ROTATION_SECTOR_RADS) % _ROTATION_SECTOR_COUNT
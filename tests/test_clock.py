@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import pytest
+
+from charz import Clock, Engine, HeadlessScreen, Time
+from charz import _clock
+
+
+class FakeTime:
+    """Replaces `time` in `charz._clock`, where time only passes when asked."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def perf_counter(self) -> float:
+        self.now += 1e-6  # Some time passes between calls, so spinning ends
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_time(monkeypatch: pytest.MonkeyPatch) -> FakeTime:
+    fake = FakeTime()
+    monkeypatch.setattr(_clock, "time", fake)
+    return fake
+
+
+def test_delta_is_measured_frame_time(fake_time: FakeTime) -> None:
+    clock = Clock(fps=1000)
+    clock.tick()
+    fake_time.now += 0.02
+    clock.tick()
+    assert clock.delta == pytest.approx(0.02, abs=1e-4)  # Frame ran long, so no sleeping
+
+
+def test_zero_fps_does_not_sleep(fake_time: FakeTime) -> None:
+    clock = Clock(fps=0)
+    assert clock.delta == 0
+    clock.tick()
+    assert 0 < clock.delta < 1e-4
+
+
+def test_precise_mode_does_not_drift(fake_time: FakeTime) -> None:
+    clock = Clock(fps=200, precise=True)
+    clock.tick()
+    start = fake_time.now
+    real_sleep = fake_time.sleep
+
+    def oversleep(seconds: float) -> None:
+        real_sleep(seconds + 0.003)  # Waking up late, even after `spin_time`
+
+    fake_time.sleep = oversleep  # type: ignore[method-assign]
+    total_delta = 0.0
+    for _ in range(20):
+        clock.tick()
+        total_delta += clock.delta
+    # Oversleeping is caught up on the following frames, instead of adding up
+    assert fake_time.now - start == pytest.approx(0.1, abs=0.002)
+    assert total_delta == pytest.approx(0.1, abs=0.002)
+
+
+def test_smoothing() -> None:
+    clock = Clock(fps=0, smoothing=0.75)
+    clock._delta = 1
+    clock.tick()
+    assert 0.75 <= clock.delta < 0.76
+
+
+def test_reset_excludes_time_before_running(fake_time: FakeTime) -> None:
+    clock = Clock(fps=60, precise=True)
+    fake_time.now += 100  # Like time between import and running
+    clock.reset()
+    clock.tick()
+    assert clock.delta == pytest.approx(1 / 60, abs=1e-4)
+
+
+def test_engine_resets_clock_when_run(fake_time: FakeTime) -> None:
+    class Game(Engine):
+        clock = Clock(fps=60)
+        screen = HeadlessScreen()
+        max_frame_skips = 1
+        deltas: list[float] = []
+
+        def update(self) -> None:
+            self.deltas.append(Time.delta)
+            if len(self.deltas) == 2:
+                self.is_running = False
+
+    fake_time.now += 100
+    game = Game()
+    game.run()
+    assert game.deltas[1] == pytest.approx(1 / 60, abs=1e-4)
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from charz import Clock, Engine, HeadlessScreen, Profiler, Time
+
+
+class SlowScreen(HeadlessScreen):
+    refresh_count: int = 0
+
+    def refresh(self) -> None:
+        self.refresh_count += 1
+        self.refresh_time = 1  # Slower than any frame
+
+
+def test_refresh_is_skipped_at_most_max_frame_skips_in_a_row() -> None:
+    class Game(Engine):
+        clock = Clock(fps=1000)
+        screen = SlowScreen()
+        max_frame_skips = 2
+        frame_count = 0
+
+        def update(self) -> None:
+            self.frame_count += 1
+            if self.frame_count == 6:
+                self.is_running = False
+
+    game = Game()
+    game.screen.refresh_time = 1
+    game.run()
+    assert game.frame_count == 6
+    assert game.screen.refresh_count == 2  # On frame 3 and 6
+
+
+class SteadyClock(Clock):
+    def tick(self) -> None:
+        self._delta = 0.025  # Deterministic frame time
+
+
+def test_fixed_steps_catch_up_with_real_time() -> None:
+    class Game(Engine):
+        clock = SteadyClock()
+        screen = HeadlessScreen()
+        fixed_fps = 100
+        step_count = 0
+        step_deltas: set[float] = set()
+        frames: list[tuple[int, float]] = []
+
+        def update(self) -> None:
+            self.step_count += 1
+            self.step_deltas.add(Time.delta)
+
+    def record_frame(game: Game) -> None:
+        game.frames.append((game.step_count, round(Time.alpha, 6)))
+        if len(game.frames) == 4:
+            game.is_running = False
+
+    Game.frame_tasks[75] = record_frame
+    try:
+        game = Game()
+        game.run()
+    finally:
+        del Game.frame_tasks[75]
+    assert game.step_deltas == {0.01}
+    # 1 step in the first frame, then 2.5 steps per frame
+    assert game.frames == [(1, 0), (3, 0.5), (6, 0), (8, 0.5)]
+
+
+def test_fixed_steps_are_capped() -> None:
+    class Game(Engine):
+        clock = SteadyClock()
+        screen = HeadlessScreen()
+        fixed_fps = 1000
+        max_fixed_steps = 3
+        step_count = 0
+        frame_count = 0
+
+        def update(self) -> None:
+            self.step_count += 1
+
+    def count_frame(game: Game) -> None:
+        game.frame_count += 1
+        if game.frame_count == 3:
+            game.is_running = False
+
+    Game.frame_tasks[75] = count_frame
+    try:
+        game = Game()
+        game.run()
+    finally:
+        del Game.frame_tasks[75]
+    assert game.step_count == 1 + 3 + 3
+
+
+class AsyncOnlyClock(Clock):
+    def tick(self) -> None:
+        raise AssertionError("Blocking tick called")
+
+
+def test_run_async_interleaves_engines() -> None:
+    events: list[str] = []
+
+    class Game(Engine):
+        screen = HeadlessScreen()
+        frame_count = 0
+
+        def update(self) -> None:
+            self.frame_count += 1
+            events.append(type(self).__name__)
+            if self.frame_count == 3:
+                self.is_running = False
+
+    class GameA(Game):
+        clock = AsyncOnlyClock(fps=200)
+
+    class GameB(Game):
+        clock = AsyncOnlyClock(fps=200)
+
+    async def main() -> None:
+        await asyncio.gather(GameA().run_async(), GameB().run_async())
+
+    asyncio.run(main())
+    assert events == ["GameA", "GameB"] * 3
+    assert GameA.clock.delta > 0
+
+
+def test_run_async_cleans_up_when_cancelled() -> None:
+    class CleanupScreen(HeadlessScreen):
+        cleanup_count: int = 0
+
+        def on_cleanup(self) -> None:
+            self.cleanup_count += 1
+
+    class Game(Engine):
+        clock = AsyncOnlyClock(fps=200)
+        screen = CleanupScreen()
+        profiler = Profiler()
+        frame_count = 0
+
+        def update(self) -> None:
+            self.frame_count += 1
+
+    game = Game()
+
+    async def main() -> None:
+        task = asyncio.create_task(game.run_async())
+        while game.frame_count < 2:
+            await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    assert not game._is_running_async
+    assert not game._is_awaiting_clock
+    assert not game.profiler.enabled
+    assert game.screen.cleanup_count == 1
+
+
+def test_run_async_yields_without_tick_clock() -> None:
+    events: list[str] = []
+
+    class Game(Engine):
+        screen = HeadlessScreen()
+        frame_count = 0
+
+        def update(self) -> None:
+            self.frame_count += 1
+            events.append(type(self).__name__)
+            if self.frame_count == 3:
+                self.is_running = False
+
+    class GameA(Game):
+        pass
+
+    class GameB(Game):
+        pass
+
+    async def main() -> None:
+        await asyncio.gather(GameA().run_async(), GameB().run_async())
+
+    tick_clock_priority = 70
+    original_task = Engine.frame_tasks.pop(tick_clock_priority)
+    try:
+        asyncio.run(main())
+    finally:
+        Engine.frame_tasks[tick_clock_priority] = original_task
+    assert events == ["GameA", "GameB"] * 3
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from math import pi
+
+from charz import HeadlessScreen, Scene, ScreenSnapshot, Sprite, Vec2
+
+RED = "\x1b[31m"
+BLUE = "\x1b[34m"
+
+
+def test_snapshot_of_rendered_frame() -> None:
+    screen = HeadlessScreen(width=6, height=2)
+    red = "\x1b[31m"
+    Sprite(texture=["##"], color=red, position=Vec2(1, 1))
+    screen.refresh()
+    snapshot = screen.snapshot()
+    assert snapshot.rows == ("      ", " ##   ")
+    assert snapshot.color_runs == (((None, 6),), ((None, 1), (red, 2), (None, 3)))
+    assert str(snapshot) == "      \n ##   "
+    assert screen.encode(ansi=False) == str(snapshot)
+    assert red + "##" in screen.encode()
+
+
+def render_twice(screen: HeadlessScreen) -> ScreenSnapshot:
+    screen.refresh()
+    snapshot = screen.snapshot()
+    screen.refresh()  # Uses cached rotated cells, which must give the same frame
+    assert screen.snapshot() == snapshot
+    return snapshot
+
+
+def render_rotated(rotation: float, *, centered: bool = False) -> ScreenSnapshot:
+    Scene()
+    Sprite(
+        texture=["ab-", "c|d"],
+        position=Vec2(4, 3),
+        rotation=rotation,
+        centered=centered,
+        color=RED,
+    )
+    return render_twice(HeadlessScreen(width=8, height=6))
+
+
+def test_snapshot_of_rotated_nodes() -> None:
+    assert render_rotated(pi / 2).rows == (
+        "        ",
+        "    |b  ",
+        "    p-  ",
+        "    ac  ",
+        "        ",
+        "        ",
+    )
+    assert render_rotated(pi, centered=True).rows == (
+        "        ",
+        "        ",
+        "        ",
+        "   p|c  ",
+        "   -qa  ",
+        "        ",
+    )
+    assert render_rotated(-pi / 2, centered=True).rows == (
+        "        ",
+        "    ca  ",
+        "    -d  ",
+        "    q|  ",
+        "        ",
+        "        ",
+    )
+    assert render_rotated(0.3, centered=True).rows == (
+        "        ",
+        "    -   ",
+        "  abd   ",
+        "  c|    ",
+        "        ",
+        "        ",
+    )
+    snapshot = render_rotated(pi / 4, centered=True)
+    assert snapshot.rows == (
+        "        ",
+        "   /    ",
+        "  p b   ",
+        "  a\\    ",
+        "  c     ",
+        "        ",
+    )
+    assert snapshot.color_runs == (
+        ((None, 8),),
+        ((None, 3), (RED, 1), (None, 4)),
+        ((None, 2), (RED, 1), (None, 1), (RED, 1), (None, 3)),
+        ((None, 2), (RED, 2), (None, 4)),
+        ((None, 2), (RED, 1), (None, 5)),
+        ((None, 8),),
+    )
+
+
+def test_snapshot_of_centered_nodes() -> None:
+    Scene()
+    Sprite(texture=["123", "456", "789"], position=Vec2(4, 3), centered=True)
+    Sprite(texture=["ab", "cd"], position=Vec2(1.5, 1.5), centered=True, color=BLUE)
+    snapshot = render_twice(HeadlessScreen(width=8, height=6))
+    assert snapshot.rows == (
+        "ab      ",
+        "cd123   ",
+        "  456   ",
+        "  789   ",
+        "        ",
+        "        ",
+    )
+    assert snapshot.color_runs[:2] == (((BLUE, 2), (None, 6)),) * 2
+
+
+def test_snapshot_of_transparent_nodes() -> None:
+    Scene()
+    Sprite(texture=["#####", "#####"], position=Vec2(1, 1), color=BLUE)
+    Sprite(
+        texture=[".o.", "o.o"],
+        position=Vec2(2, 1),
+        transparency=".",
+        z_index=1,
+        color=RED,
+    )
+    Sprite(texture=["x x"], position=Vec2(0, 4))  # Spaces are drawn without transparency
+    snapshot = render_twice(HeadlessScreen(width=8, height=6))
+    assert snapshot.rows == (
+        "        ",
+        " ##o##  ",
+        " #o#o#  ",
+        "        ",
+        "x x     ",
+        "        ",
+    )
+    assert snapshot.color_runs[1:3] == (
+        ((None, 1), (BLUE, 2), (RED, 1), (BLUE, 2), (None, 2)),
+        ((None, 1), (BLUE, 1), (RED, 1), (BLUE, 1), (RED, 1), (BLUE, 1), (None, 2)),
+    )
+
+
+def test_snapshot_of_partly_clipped_nodes() -> None:
+    Scene()
+    Sprite(texture=["abcd", "efgh", "ijkl"], position=Vec2(-2, -1))
+    Sprite(texture=["mnop", "qrst"], position=Vec2(6, 4), color=RED)
+    Sprite(texture=["uv", "wx"], position=Vec2(7, -1), rotation=pi / 2, centered=True)
+    Sprite(texture=["outside"], position=Vec2(20, 2))
+    snapshot = render_twice(HeadlessScreen(width=8, height=6))
+    assert snapshot.rows == (
+        "gh     w",
+        "kl      ",
+        "        ",
+        "        ",
+        "      mn",
+        "      qr",
+    )
+    assert snapshot.color_runs[4:] == (((None, 6), (RED, 2)),) * 2
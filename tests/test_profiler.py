@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+
+import pytest
+
+from charz import Clock, Engine, HeadlessScreen, Profiler, Scene
+from charz import _profiler
+
+
+def test_profiler_times_frame_tasks_while_running(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Time only passes in `update`, so durations are exact
+    now = 0
+
+    def perf_counter_ns() -> int:
+        return now
+
+    monkeypatch.setattr(_profiler, "perf_counter_ns", perf_counter_ns)
+
+    class Game(Engine):
+        clock = Clock(fps=0)
+        screen = HeadlessScreen()
+        profiler = Profiler(window=3)
+        frame_count = 0
+
+        def update(self) -> None:
+            nonlocal now
+            self.frame_count += 1
+            now += 2_000_000
+            if self.frame_count == 5:
+                self.is_running = False
+
+    Scene()
+    original_tasks = dict(Engine.frame_tasks), dict(Scene.frame_tasks)
+    game = Game()
+    game.run()
+    assert not game.profiler.enabled
+    assert (dict(Engine.frame_tasks), dict(Scene.frame_tasks)) == original_tasks
+    timings = game.profiler.get_timings()
+    assert timings["Engine.update_self_engine"].count == 3  # Rolling window
+    assert timings["Engine.update_self_engine"].p50 == 0.002
+    assert timings["Scene.progress_animations"].count == 3
+    assert game.profiler.get_percentile("Engine.refresh_screen", 99) == 0
+    assert game.profiler.report().splitlines()[1].startswith("Engine.update_self_engine")
+
+
+def test_percentiles_use_nearest_rank() -> None:
+    profiler = Profiler()
+    profiler._samples["task"] = deque(range(1_000_000, 101_000_000, 1_000_000))
+    assert profiler.get_percentile("task", 50) == 0.05
+    assert profiler.get_percentile("task", 95) == 0.095
+    assert profiler.get_percentile("task", 100) == 0.1
+    assert profiler.get_percentile("task", 0) == 0.001
+
+
+def test_profilers_of_engines_sharing_event_loop_restore_tasks() -> None:
+    class Game(Engine):
+        clock = Clock(fps=0)
+        screen = HeadlessScreen()
+        last_frame = 0
+        frame_count = 0
+
+        def update(self) -> None:
+            self.frame_count += 1
+            if self.frame_count == self.last_frame:
+                self.is_running = False
+
+    class GameA(Game):
+        profiler = Profiler()
+        last_frame = 2  # Disabled first, while wrapped by profiler of `GameB`
+
+    class GameB(Game):
+        profiler = Profiler()
+        last_frame = 4
+
+    async def main() -> None:
+        await asyncio.gather(GameA().run_async(), GameB().run_async())
+
+    Scene()
+    original_tasks = dict(Engine.frame_tasks), dict(Scene.frame_tasks)
+    asyncio.run(main())
+    assert (dict(Engine.frame_tasks), dict(Scene.frame_tasks)) == original_tasks
+    assert not GameA.profiler.enabled
+    assert not GameB.profiler.enabled
+
+
+def test_profiler_is_disabled_when_run_raises() -> None:
+    class Game(Engine):
+        clock = Clock(fps=0)
+        screen = HeadlessScreen()
+        profiler = Profiler()
+
+        def update(self) -> None:
+            raise KeyboardInterrupt
+
+    Scene()
+    original_tasks = dict(Engine.frame_tasks), dict(Scene.frame_tasks)
+    game = Game()
+    with pytest.raises(KeyboardInterrupt):
+        game.run()
+    assert not game.profiler.enabled
+    assert (dict(Engine.frame_tasks), dict(Scene.frame_tasks)) == original_tasks
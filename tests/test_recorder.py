@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from charz import HeadlessScreen, Recorder
+
+
+def test_recorder_writes_asciicast_with_changed_cells(tmp_path: Path) -> None:
+    path = tmp_path / "session.cast"
+    screen = HeadlessScreen(width=8, height=3, recorder=Recorder(path))
+    screen.show()
+    screen.show()  # Unchanged, so skipped
+    screen.buffer[1][5] = ("@", None)
+    screen.show()
+    screen.on_cleanup()
+    assert screen.recorder.closed
+    header, *events = map(json.loads, path.read_text("utf-8").splitlines())
+    assert header["version"] == 2
+    assert (header["width"], header["height"]) == (8, 3)
+    assert len(events) == 2
+    assert all(code == "o" for _time, code, _data in events)
+    assert events[0][2].count(" ") == 8 * 3
+    # Rows are separated like terminal output, so playback starts each row at column 0
+    assert events[0][2].count("\r\n") == 2
+    assert "\n" not in events[0][2].replace("\r\n", "")
+    assert "\x1b[1B\r\x1b[5C@" in events[1][2]
+    assert " " not in events[1][2]
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from charz import Scene, Sprite
+from charz._render_order import get_render_order
+
+
+def test_render_list_is_sorted_and_stable() -> None:
+    scene = Scene()
+    first = Sprite(z_index=1)
+    second = Sprite()
+    third = Sprite(z_index=1)
+    render_order = get_render_order(scene)
+    assert render_order.get_render_list() == (second, first, third)
+    first.z_index = 0
+    # Older node stays below newer node with same z-index
+    assert render_order.get_render_list() == (first, second, third)
+
+
+def test_render_list_is_cached_until_changed() -> None:
+    scene = Scene()
+    Sprite()
+    render_order = get_render_order(scene)
+    render_list = render_order.get_render_list()
+    assert render_order.get_render_list() is render_list
+    Sprite()
+    assert render_order.get_render_list() is not render_list
+
+
+def test_freed_nodes_are_removed() -> None:
+    scene = Scene()
+    kept = Sprite()
+    freed = Sprite()
+    freed.queue_free()
+    scene.process()
+    assert get_render_order(scene).get_render_list() == (kept,)
+    freed.z_index = 3  # Changing z-index after being freed does not add it back
+    assert get_render_order(scene).get_render_list() == (kept,)
+
+
+def test_global_visibility_follows_ancestors() -> None:
+    Scene()
+    root = Sprite()
+    child = Sprite(parent=root)
+    leaf = Sprite(parent=child)
+    assert leaf.is_globally_visible()
+    root.hide()
+    assert not leaf.is_globally_visible()
+    leaf.parent = None
+    assert leaf.is_globally_visible()
+    leaf.parent = child
+    root.show()
+    child.visible = False
+    assert not leaf.is_globally_visible()
+    assert root.is_globally_visible()
+
+
+def test_class_attribute_overrides_are_watched() -> None:
+    class Background(Sprite):
+        z_index = -1
+        visible = False
+
+    scene = Scene()
+    front = Sprite()
+    back = Background()
+    assert back.z_index == -1
+    assert not back.is_globally_visible()
+    render_order = get_render_order(scene)
+    assert render_order.get_render_list() == (back, front)
+    back.z_index = 1
+    assert render_order.get_render_list() == (front, back)
+    back.show()
+    assert back.is_globally_visible()
+
+
+def test_class_attribute_overrides_of_mixins_are_watched() -> None:
+    class OnTop:
+        z_index = 5
+
+    class Marker(OnTop, Sprite):
+        pass
+
+    scene = Scene()
+    marker = Marker()
+    middle = Sprite(z_index=1)
+    render_order = get_render_order(scene)
+    assert marker.z_index == 5
+    assert render_order.get_render_list() == (middle, marker)
+    marker.z_index = -3
+    assert "z_index" not in vars(marker)
+    assert render_order.get_render_list() == (marker, middle)
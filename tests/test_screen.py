@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import io
+import os
+import sys
+import signal
+import struct
+
+import pytest
+
+from charz import Camera, HeadlessScreen, Scene, Screen, Sprite, Vec2, Viewport
+
+if sys.platform != "win32":  # Used for pseudo terminals
+    import fcntl
+    import termios
+
+
+def make_screen(**kwargs: object) -> tuple[Screen, io.StringIO]:
+    stream = io.StringIO()
+    screen = Screen(
+        width=8,
+        height=3,
+        stream=stream,
+        color_choice=Screen.COLOR_CHOICE_ALWAYS,
+        **kwargs,  # type: ignore[arg-type]
+    )
+    return screen, stream
+
+
+def test_diff_output_skips_unchanged_frame() -> None:
+    screen, stream = make_screen(diff_output=True)
+    screen.show()
+    assert stream.getvalue()
+    stream.seek(0)
+    stream.truncate()
+    screen.show()
+    assert stream.getvalue() == ""
+
+
+def test_diff_output_writes_changed_cell_only() -> None:
+    screen, stream = make_screen(diff_output=True)
+    screen.show()
+    stream.seek(0)
+    stream.truncate()
+    screen.buffer[1][5] = ("@", None)
+    screen.show()
+    out = stream.getvalue()
+    assert out.count("@") == 1
+    assert " " not in out
+    assert "\x1b[1B\r\x1b[5C@" in out
+
+
+def test_diff_output_redraws_after_resize() -> None:
+    screen, stream = make_screen(diff_output=True)
+    screen.show()
+    screen.width = 10
+    screen.reset_buffer()
+    stream.seek(0)
+    stream.truncate()
+    screen.show()
+    assert stream.getvalue().count(" ") == 10 * 3
+
+
+def test_color_codes_are_emitted_per_run() -> None:
+    screen, stream = make_screen()
+    red = "\x1b[31m"
+    screen.buffer[0] = [("#", red)] * 8
+    screen.show()
+    out = stream.getvalue()
+    assert out.count(red) == 1
+    assert red + "#" * 8 in out
+
+
+def test_buffer_view_round_trip() -> None:
+    screen, _stream = make_screen()
+    red = "\x1b[31m"
+    screen.buffer[2][-1] = ("#", red)
+    assert screen.buffer[2][7] == ("#", red)
+    assert screen.buffer[0] == [(" ", None)] * 8
+    screen.reset_buffer()
+    assert screen.buffer[2][7] == (" ", None)
+
+
+def test_byte_output_matches_text_output() -> None:
+    read_fd, write_fd = os.pipe()
+    with os.fdopen(write_fd, "w", encoding="utf-8") as pipe_stream:
+        byte_screen = Screen(
+            width=8,
+            height=3,
+            stream=pipe_stream,
+            color_choice=Screen.COLOR_CHOICE_ALWAYS,
+            byte_output=True,
+        )
+        text_screen, stream = make_screen()
+        for screen in (byte_screen, text_screen):
+            screen.buffer[1][2] = ("é", "\x1b[31m")
+            screen.show()
+    with os.fdopen(read_fd, "rb") as pipe_reader:
+        assert pipe_reader.read().decode("utf-8") == stream.getvalue()
+
+
+def test_byte_output_falls_back_to_text_stream() -> None:
+    screen, stream = make_screen(byte_output=True)
+    screen.show()
+    assert stream.getvalue().count("\n") == 2
+
+
+def test_threaded_output_keeps_startup_and_cleanup_codes_ordered() -> None:
+    screen, stream = make_screen(threaded_output=True, final_clear=False)
+    screen.on_startup()
+    for char in "abc":
+        screen.buffer[0][0] = (char, None)
+        screen.show()
+    screen.on_cleanup()
+    out = stream.getvalue()
+    assert out.startswith("\x1b[2J\x1b[H\x1b[?25l")
+    assert out.endswith("\x1b[?25h")
+    assert "c" in out
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32" or not hasattr(signal, "SIGWINCH"),
+    reason="Requires pseudo terminals and SIGWINCH",
+)
+def test_terminal_size_is_cached_until_resized() -> None:
+    def set_terminal_size(fd: int, columns: int, lines: int) -> None:
+        fcntl.ioctl(fd, termios.TIOCSWINSZ, struct.pack("HHHH", lines, columns, 0, 0))
+
+    master_fd, slave_fd = os.openpty()
+    set_terminal_size(slave_fd, 40, 10)
+    with os.fdopen(master_fd, "rb"), os.fdopen(slave_fd, "w") as terminal_stream:
+        screen = Screen(
+            stream=terminal_stream,
+            auto_resize=True,
+            initial_clear=False,
+            hide_cursor=False,
+        )
+        screen.on_startup()
+        assert (screen.width, screen.height) == (39, 9)
+        set_terminal_size(slave_fd, 60, 20)
+        screen.refresh()
+        assert (screen.width, screen.height) == (39, 9)  # Not resized until signaled
+        os.kill(os.getpid(), signal.SIGWINCH)
+        screen.refresh()
+        assert (screen.width, screen.height) == (59, 19)
+        assert len(screen.buffer) == 19
+
+
+def test_palette_starts_over_when_too_large() -> None:
+    Scene()
+    screen = HeadlessScreen(width=2, height=1)
+    screen.max_palette_size = 3
+    green = "\x1b[32m"
+    Sprite(texture=[".."], static=True, color=green)
+    sprite = Sprite(texture=["@"])
+    for code in range(31, 38):
+        sprite.color = f"\x1b[{code}m"
+        screen.refresh()
+        # Also checks that the cached static layer is not using old color ids
+        assert screen.buffer[0] == [("@", sprite.color), (".", green)]
+    assert len(screen._frame_buffer.palette) <= screen.max_palette_size + 1
+
+
+def test_static_layer_is_reused_until_changed() -> None:
+    Scene()
+    screen = HeadlessScreen(width=4, height=1)
+    backdrop = Sprite(texture=["...."], static=True)
+    Sprite(texture=["@"], position=Vec2(1, 0), z_index=-1)
+    screen.refresh()
+    # Static nodes are drawn below other nodes, regardless of z-index
+    assert screen.snapshot().rows == (".@..",)
+    assert screen._static_layer is None  # Cached once unchanged for a frame
+    screen.refresh()
+    static_layer = screen._static_layer
+    assert static_layer is not None
+    screen.refresh()
+    assert screen._static_layer is static_layer
+    assert screen.snapshot().rows == (".@..",)
+    backdrop.texture[0] = "####"
+    screen.refresh()
+    assert screen.snapshot().rows == ("#@##",)
+    backdrop.position.x += 1
+    screen.refresh()
+    assert screen.snapshot().rows == (" @##",)
+    # Not cached while the camera keeps moving
+    previous_camera = Camera.current
+    camera = Camera(current=True)
+    try:
+        for _ in range(3):
+            camera.position.x -= 1
+            screen.refresh()
+            assert screen._static_layer is None
+        assert screen.snapshot().rows == ("    ",)
+    finally:
+        Camera.current = previous_camera
+
+
+def test_viewports_render_from_own_camera_with_clipping() -> None:
+    Scene()
+    Sprite(texture=["abc"], position=Vec2(1, 0))
+    left_camera = Camera()
+    right_camera = Camera(position=Vec2(2, 0))
+    screen = HeadlessScreen(
+        width=7,
+        height=1,
+        viewports=[
+            Viewport(0, 0, 3, 1, left_camera),
+            Viewport(4, 0, 3, 1, right_camera),
+        ],
+    )
+    screen.refresh()
+    assert screen.snapshot().rows == (" ab bc ",)
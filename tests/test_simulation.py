@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from charz import Clock, Engine, HeadlessScreen, Scene, Sprite, Time, simulate
+
+
+class CountingScreen(HeadlessScreen):
+    refresh_count: int = 0
+
+    def refresh(self) -> None:
+        self.refresh_count += 1
+
+
+def test_simulate_engine_without_clock_or_screen() -> None:
+    class Game(Engine):
+        clock = Clock(fps=1)  # Would sleep for a second each frame
+        screen = CountingScreen()
+        distance = 0.0
+
+        def update(self) -> None:
+            self.distance += 2 * Time.delta
+
+    game = Game()
+    stats = simulate(game, 600, delta=0.5)
+    assert game.distance == 600
+    assert game.screen.refresh_count == 0
+    assert stats.frame_count == 600
+    assert stats.simulated == 300
+    assert stats.elapsed < 1
+    assert stats.speedup > 300
+
+    assert not game.is_running  # Restored after simulating
+
+    game.max_frame_skips = 3  # Ignored, since the clock is not ticked
+    simulate(game, 30, render=True)
+    assert game.screen.refresh_count == 30
+
+
+def test_simulate_stops_when_engine_stops() -> None:
+    class Game(Engine):
+        screen = CountingScreen()
+        frame_count = 0
+
+        def update(self) -> None:
+            self.frame_count += 1
+            if self.frame_count == 5:
+                self.is_running = False
+
+    assert simulate(Game(), 100).frame_count == 5
+
+
+def test_simulate_scene() -> None:
+    class Mover(Sprite):
+        def update(self) -> None:
+            self.position.x += Time.delta
+
+    scene = Scene()
+    mover = Mover()
+    Scene()  # Another scene is made current
+    stats = simulate(scene, 10, delta=0.25)
+    assert Scene.current is scene
+    assert mover.position.x == 2.5
+    assert stats.frame_count == 10
@@ -0,0 +1,32 @@
+from math import pi
+
+from charz import text
+
+
+def test_rotate_quantizes_by_sector() -> None:
+    assert text.rotate("-", 0) == "-"
+    assert text.rotate("-", pi / 4) == "/"
+    assert text.rotate("-", pi / 2 - 0.1) == "|"
+    assert text.rotate("-", -pi / 4) == "\\"
+    assert text.rotate("b", pi) == "q"
+    assert text.rotate("x", 1.0) == "x"
+
+
+def test_rotate_lines_matches_rotate() -> None:
+    texture = ["-.b9", "|xdp"]
+    for step in range(-32, 33):
+        angle = step * pi / 13
+        assert text.rotate_lines(texture, angle) == [
+            "".join(text.rotate(char, angle) for char in line) for line in texture
+        ]
+        assert text.rotate_line(texture[0], angle) == text.rotate_lines(texture, angle)[0]
+
+
+def test_flip_lines() -> None:
+    texture = ["/(d ", "q.b\\", ""]
+    assert text.flip_lines_h(texture) == [" b)\\", "/d.p", ""]
+    assert text.flip_lines_v(texture) == ["", "d'p/", "\\(q "]
+    assert text.flip_lines_h([]) == []
+    assert text.flip_lines_v(["a\nv"]) == ["a\n^"]
+    assert text.flip_frames_h([texture, ["d"]]) == [text.flip_lines_h(texture), ["b"]]
+    assert text.flip_frames_v([texture, ["d"]]) == [text.flip_lines_v(texture), ["q"]]
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import pytest
+
+from charz import HeadlessScreen, Scene, TileMap, Vec2, Vec2i
+
+
+class Level(TileMap):
+    tile_size = Vec2i(2, 1)
+    chunk_size = 2
+    tile_set = {
+        1: ["##"],
+        2: ["~~"],
+    }
+
+
+def test_tile_map_renders_visible_chunks() -> None:
+    Scene()
+    screen = HeadlessScreen(width=6, height=2)
+    level = Level(position=Vec2(-2, 0), transparency=".")
+    level.set_cell(Vec2i(1, 0), 1)
+    level.set_cell((2, 1), 2)
+    level.set_cell((1000, 1000), 2)  # Far outside the viewport
+    screen.refresh()
+    assert screen.snapshot().rows == ("##    ", "  ~~  ")
+    level.erase_cell((1000, 1000))
+    assert level.get_cell((1000, 1000)) == TileMap.EMPTY
+    assert sorted(map(tuple, level.get_used_cells())) == [(1, 0), (2, 1)]
+
+
+def test_tile_map_rejects_unknown_tiles() -> None:
+    Scene()
+    level = Level()
+    with pytest.raises(KeyError):
+        level.set_cell((0, 0), 3)
+    with pytest.raises(ValueError, match="tile size"):
+        level.set_tile(3, ["###"])